@@ -1,6 +1,8 @@
+from functools import lru_cache
 from importlib.metadata import version, PackageNotFoundError
 
 
+@lru_cache(maxsize=None)
 def get_version():
     """Return the installed package version.
 
@@ -9,7 +11,8 @@ def get_version():
     str
         Installed ``pymkmkit`` version string, or ``"unknown"`` when the
         distribution metadata cannot be resolved (for example in editable or
-        source-only environments).
+        source-only environments). The metadata lookup is performed once
+        per process.
     """
     try:
         return version("pymkmkit")
@@ -1,19 +1,14 @@
+from __future__ import annotations
+
 from collections import Counter
 from pathlib import Path
 import shutil
 
 import click
-import numpy as np
 import yaml
 from rich.console import Console
 
-from pymkmkit.network_reader import build_fnf, build_ped, evaluate_paths, read_network
-from pymkmkit.vasp_freq import (
-    parse_ase_vibrations,
-    parse_vasp_frequency,
-    parse_vasp_optimization,
-)
-from pymkmkit.yaml_writer import write_yaml
+from pymkmkit.yaml_writer import _YamlLoader
 
 
 @click.group()
@@ -59,6 +54,8 @@ def _should_flip_hessian_sign(eigenvalues: np.ndarray, vibrations: dict | None,
     - If no imaginary frequencies are present, flip when negative eigenvalues dominate.
     - Without frequency metadata, use the same negative-dominance heuristic.
     """
+    import numpy as np
+
     vibrations = vibrations or {}
     imag_freqs = vibrations.get("imaginary_cm-1")
     if isinstance(imag_freqs, list) and len(imag_freqs) > 0:
@@ -160,7 +157,7 @@ def _collect_structure_paths(
     output_path = Path(output).resolve()
 
     with network_path.open("r", encoding="utf-8") as stream:
-        network_data = yaml.safe_load(stream) or {}
+        network_data = yaml.load(stream, Loader=_YamlLoader) or {}
 
     destination_dir = output_path.parent / structures_dir_name
     destination_dir.mkdir(parents=True, exist_ok=True)
@@ -342,6 +339,8 @@ def freq2yaml(outcar, output, average_pairs):
     average_pairs : bool
         Whether sequential vibrational modes should be pair-averaged.
     """
+    from pymkmkit.vasp_freq import parse_vasp_frequency
+    from pymkmkit.yaml_writer import write_yaml
 
     _ensure_output_dir(output)
 
@@ -373,11 +372,12 @@ def freq2yaml(outcar, output, average_pairs):
 )
 def checkhessian(input_yaml, output):
     """Check partial Hessian sign using eigenvalues and flip if needed."""
+    import numpy as np
 
     _ensure_output_dir(output)
 
     input_text = Path(input_yaml).read_text(encoding="utf-8")
-    data = yaml.safe_load(input_text) or {}
+    data = yaml.load(input_text, Loader=_YamlLoader) or {}
 
     partial = ((data.get("vibrations") or {}).get("partial_hessian") or {})
     dof_labels = partial.get("dof_labels")
@@ -430,6 +430,8 @@ def opt2yaml(outcar, output):
     output : str
         Output YAML path.
     """
+    from pymkmkit.vasp_freq import parse_vasp_optimization
+    from pymkmkit.yaml_writer import write_yaml
 
     _ensure_output_dir(output)
 
@@ -453,6 +455,8 @@ def opt2yaml(outcar, output):
 )
 def asevib2yaml(outcar, output):
     """Convert OUTCAR + sibling ``vibX`` ASE caches to a single YAML file."""
+    from pymkmkit.vasp_freq import parse_ase_vibrations
+    from pymkmkit.yaml_writer import write_yaml
 
     _ensure_output_dir(output)
 
@@ -486,8 +490,9 @@ def read_network_command(network_file, unit):
     network_file : str
         Path to the network YAML file.
     """
+    from pymkmkit.network_reader import read_network
 
-    steps = read_network(network_file)
+    steps = read_network(network_file, equations=False)
     console = Console()
 
     for step in steps:
@@ -528,6 +533,7 @@ def evaluate_paths_command(network_file):
     network_file : str
         Path to the network YAML file.
     """
+    from pymkmkit.network_reader import evaluate_paths
 
     paths = evaluate_paths(network_file)
 
@@ -558,6 +564,7 @@ def build_ped_command(network_file, path_name, output_file):
     output_file : str | None
         Optional output image path. If omitted, a GUI window is shown.
     """
+    from pymkmkit.network_reader import build_ped
 
     build_ped(network_file, path_name, output_file)
 
@@ -618,6 +625,8 @@ def build_ped_command(network_file, path_name, output_file):
 )
 def network2fnf_command(network_file, output, unit, merge, split, prune, structures):
     """Convert a network YAML definition to a formatted network file (FNF)."""
+    from pymkmkit.network_reader import build_fnf
+
     _ensure_output_dir(output)
     output_path = Path(output)
 
@@ -644,7 +653,7 @@ def network2fnf_command(network_file, output, unit, merge, split, prune, structu
 
     if merge and output_path.exists():
         with output_path.open("r", encoding="utf-8") as stream:
-            existing_payload = yaml.safe_load(stream) or {}
+            existing_payload = yaml.load(stream, Loader=_YamlLoader) or {}
         merged_payload, report = _merge_fnf_payloads(existing_payload, fnf_payload)
         _dump_yaml_with_step_warnings(merged_payload, output, warning_steps)
         _print_merge_report(report)
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from dataclasses import dataclass
+import math
+import os
 from pathlib import Path
 import re
 
 import yaml
 
+from pymkmkit.yaml_writer import _YamlLoader
+
 EV_PER_CM1 = 1.239841984e-4
 KJMOL_PER_EV = 96.48533212
 
+# Plain YAML numbers; these are used as-is without a float() round trip.
+# ``bool`` is deliberately excluded (``type(True) is bool``).
+_NUMBER_TYPES = (int, float)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     """Thermodynamic state used in network energy bookkeeping.
 
@@ -29,20 +39,21 @@ class State:
     paired_modes_averaged: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElementaryStep:
     """Evaluated energetic quantities for one elementary reaction step.
 
     Data fields include the step identity and reaction string, the symbolic
-    forward/reverse equations used in the calculations, forward/reverse
-    electronic and ZPE terms, and net reaction-heat terms in eV.
+    forward/reverse equations used in the calculations (``None`` when they
+    were not requested), forward/reverse electronic and ZPE terms, and net
+    reaction-heat terms in eV.
     """
 
     name: str
     step_type: str
     reaction: str
-    forward_equation: str
-    reverse_equation: str
+    forward_equation: str | None
+    reverse_equation: str | None
     forward_barrier_electronic: float
     reverse_barrier_electronic: float
     forward_zpe_correction: float
@@ -54,7 +65,7 @@ class ElementaryStep:
     reaction_heat_total: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReactionPath:
     """Aggregated energy result for a named reaction pathway.
 
@@ -76,36 +87,111 @@ def _convert_energy_unit(value_ev: float, unit: str) -> float:
     return value_ev
 
 
+# Parsed YAML files keyed on (path, mtime_ns, size), least recently used
+# first, so edited files are parsed again. Cached mappings are shared
+# between callers and must not be mutated.
+_YAML_CACHE_SIZE = 256
+_yaml_cache: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+
+# Below this many uncached state files, a thread pool costs more than the
+# file reads it would overlap (YAML parsing itself holds the GIL).
+_PARALLEL_LOAD_MIN_FILES = 16
+
+
+def _parse_yaml_file(path_str: str) -> dict:
+    """Parse a YAML file without consulting the cache."""
+    # Binary stream: libyaml decodes the UTF-8 input itself.
+    with open(path_str, "rb") as stream:
+        return yaml.load(stream, Loader=_YamlLoader) or {}
+
+
+def _yaml_cache_key(path: Path, stat: os.stat_result) -> tuple[str, int, int]:
+    """Return the parse-cache key of ``path`` for the given ``stat`` result."""
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def _yaml_cache_store(key: tuple[str, int, int], data: dict) -> None:
+    """Insert a parsed file as most recently used, evicting the oldest."""
+    _yaml_cache[key] = data
+    _yaml_cache.move_to_end(key)
+    while len(_yaml_cache) > _YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+
+
+def _load_yaml(path: Path, stat: os.stat_result | None = None) -> dict:
+    """Load a YAML file through the stat-keyed parse cache.
+
+    A ``stat`` result that was already obtained for ``path`` can be passed to
+    avoid statting the file a second time.
+    """
+    if stat is None:
+        stat = path.stat()
+    key = _yaml_cache_key(path, stat)
+
+    data = _yaml_cache.get(key)
+    if data is None:
+        data = _parse_yaml_file(key[0])
+        _yaml_cache_store(key, data)
+    else:
+        _yaml_cache.move_to_end(key)
+    return data
+
+
+def _prefetch_yaml(files: dict[Path, os.stat_result]) -> None:
+    """Parse the uncached files among ``files`` into the YAML cache.
+
+    Only cache misses are read. When there are enough of them, the reads are
+    spread over a thread pool so that file I/O on slow or network storage
+    overlaps; results are stored from the calling thread.
+    """
+    misses = {}
+    for path, stat in files.items():
+        key = _yaml_cache_key(path, stat)
+        if key not in _yaml_cache:
+            misses[key] = None
+
+    if len(misses) < _PARALLEL_LOAD_MIN_FILES:
+        return
+
+    # Never prefetch more than the cache can hold at once.
+    keys = list(misses)[:_YAML_CACHE_SIZE]
+    with ThreadPoolExecutor(max_workers=min(32, len(keys))) as executor:
+        for key, data in zip(keys, executor.map(_parse_yaml_file, (k[0] for k in keys))):
+            _yaml_cache_store(key, data)
+
+
 def _read_network_yaml(network_file: str | Path) -> tuple[Path, dict]:
     """Resolve and load a network YAML file."""
     network_path = Path(network_file).resolve()
-    with network_path.open("r", encoding="utf-8") as stream:
-        network_data = yaml.safe_load(stream) or {}
-    return network_path, network_data
+    return network_path, _load_yaml(network_path)
 
 
-def _resolve_state_file(base_dir: Path, state_file: str) -> Path:
+def _resolve_state_file(base_dir: Path, state_file: str) -> tuple[Path, os.stat_result]:
     """Resolve a state file path relative to the network file directory.
 
     The function accepts explicit filenames and also tries ``.yaml`` and
-    ``.yml`` suffixes when needed.
+    ``.yml`` suffixes when needed. The ``os.stat`` result of the matched file
+    is returned alongside the path so it can be reused by the YAML cache.
+    Symlinks are resolved before ``..`` components are applied, so
+    ``State.file`` is the real location of the state file.
     """
-    path = (base_dir / state_file).resolve()
-    if path.exists():
-        return path
+    path = str((base_dir / state_file).resolve())
+    stem = os.path.splitext(path)[0]
 
-    yaml_path = path.with_suffix(".yaml")
-    if yaml_path.exists():
-        return yaml_path
-
-    yml_path = path.with_suffix(".yml")
-    if yml_path.exists():
-        return yml_path
+    for candidate in (path, stem + ".yaml", stem + ".yml"):
+        try:
+            stat = os.stat(candidate)
+        except OSError:
+            continue
+        return Path(candidate), stat
 
     raise FileNotFoundError(f"State file not found: {state_file}")
 
 
-def _read_state_data(state_path: Path) -> tuple[float, float, bool]:
+def _read_state_data(
+    state_path: Path,
+    stat: os.stat_result | None = None,
+) -> tuple[float, float, bool]:
     """Read a state YAML file and extract electronic energy and ZPE terms.
 
     Returns
@@ -114,8 +200,7 @@ def _read_state_data(state_path: Path) -> tuple[float, float, bool]:
         Electronic energy in eV, computed ZPE energy in eV, and a flag
         indicating whether vibrational modes were pair-averaged.
     """
-    with state_path.open("r", encoding="utf-8") as stream:
-        state_data = yaml.safe_load(stream) or {}
+    state_data = _load_yaml(state_path, stat)
 
     try:
         electronic_energy = float(state_data["energy"]["electronic"])
@@ -132,6 +217,8 @@ def _read_state_data(state_path: Path) -> tuple[float, float, bool]:
             f"State file '{state_path}' has invalid vibrations.frequencies_cm-1 format"
         )
 
+    # Strict per-value conversion: ``null`` or nested lists must be rejected,
+    # not turned into NaN.
     try:
         frequencies_cm1 = [float(freq) for freq in frequencies]
     except (TypeError, ValueError) as exc:
@@ -139,7 +226,7 @@ def _read_state_data(state_path: Path) -> tuple[float, float, bool]:
             f"State file '{state_path}' has non-numeric frequency values"
         ) from exc
 
-    zpe_energy = 0.5 * sum(frequencies_cm1) * EV_PER_CM1
+    zpe_energy = 0.5 * EV_PER_CM1 * math.fsum(frequencies_cm1)
 
     paired_modes_averaged = bool(vibrations.get("paired_modes_averaged", False))
 
@@ -147,8 +234,16 @@ def _read_state_data(state_path: Path) -> tuple[float, float, bool]:
 
 
 def _load_states(network_data: dict, base_dir: Path) -> dict[str, State]:
-    """Load all stable and transition states declared in a network file."""
-    states: dict[str, State] = {}
+    """Load all stable and transition states declared in a network file.
+
+    State entries are validated and resolved in declaration order; each
+    distinct state YAML file is then read once. Large batches of uncached
+    files are parsed ahead on a thread pool by :func:`_prefetch_yaml`.
+    """
+    entries: list[tuple[str, Path]] = []
+    # Several state entries may point at the same file; resolve each distinct
+    # reference only once.
+    resolved: dict[str, tuple[Path, os.stat_result]] = {}
 
     for section in ("stable_states", "transition_states"):
         for state in network_data.get(section, []):
@@ -157,201 +252,220 @@ def _load_states(network_data: dict, base_dir: Path) -> dict[str, State]:
             if not name or not state_file:
                 raise ValueError(f"Invalid state entry in '{section}': {state}")
 
-            resolved_file = _resolve_state_file(base_dir, state_file)
-            electronic_energy, zpe_energy, paired = _read_state_data(resolved_file)
-            states[name] = State(
-                name=name,
-                file=resolved_file,
-                electronic_energy=electronic_energy,
-                zpe_energy=zpe_energy,
-                paired_modes_averaged=paired,
-            )
+            if state_file not in resolved:
+                resolved[state_file] = _resolve_state_file(base_dir, state_file)
+            entries.append((name, resolved[state_file][0]))
+
+    files = dict(resolved.values())
+    _prefetch_yaml(files)
+    results = {path: _read_state_data(path, stat) for path, stat in files.items()}
+
+    states: dict[str, State] = {}
+    for name, resolved_file in entries:
+        electronic_energy, zpe_energy, paired = results[resolved_file]
+        states[name] = State(
+            name=name,
+            file=resolved_file,
+            electronic_energy=electronic_energy,
+            zpe_energy=zpe_energy,
+            paired_modes_averaged=paired,
+        )
 
     return states
 
 
-def _sum_energy(terms: list[dict], states: dict[str, State]) -> tuple[float, str]:
-    """Compute stoichiometry-weighted electronic energy and equation text."""
+def _accumulate(
+    terms: list[dict],
+    states: dict[str, State],
+    normalization_value: float,
+    equations: bool = True,
+) -> tuple[float, float, str | None, str | None]:
+    """Compute stoichiometry-weighted energy and ZPE sums in a single pass.
+
+    All term names must already be present in ``states``; see
+    :func:`_validate_term_names`.
+
+    Returns
+    -------
+    tuple[float, float, str | None, str | None]
+        Electronic energy sum, normalized ZPE sum, and the equation text for
+        both quantities (``None`` when ``equations`` is ``False``).
+    """
     if not terms:
-        return 0.0, "0"
+        return (0.0, 0.0, "0", "0") if equations else (0.0, 0.0, None, None)
 
-    total = 0.0
-    pieces: list[str] = []
+    energy_total = 0.0
+    zpe_total = 0.0
+    energy_pieces: list[str] = []
+    zpe_pieces: list[str] = []
+    energy_append = energy_pieces.append
+    zpe_append = zpe_pieces.append
 
     for term in terms:
         name = term.get("name")
         stoich = term.get("stoichiometry", 1)
 
-        if name not in states:
-            raise ValueError(f"Unknown state '{name}' referenced in network step")
+        state = states[name]
 
-        try:
-            stoich_value = float(stoich)
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"Invalid stoichiometry for state '{name}': {stoich}") from exc
+        if type(stoich) in _NUMBER_TYPES:
+            stoich_value = stoich
+        else:
+            try:
+                stoich_value = float(stoich)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"Invalid stoichiometry for state '{name}': {stoich}") from exc
 
-        total += stoich_value * states[name].electronic_energy
-        pieces.append(f"{stoich_value:g}*E({name})")
+        energy_total += stoich_value * state.electronic_energy
 
-    return total, " + ".join(pieces)
+        zpe_term = stoich_value * state.zpe_energy
+        if not state.paired_modes_averaged:
+            zpe_term /= normalization_value
+        zpe_total += zpe_term
 
+        if equations:
+            energy_append(f"{stoich_value:g}*E({name})")
+            if state.paired_modes_averaged:
+                zpe_append(f"{stoich_value:g}*ZPE({name})")
+            else:
+                zpe_append(f"({stoich_value:g}*ZPE({name})/{normalization_value:g})")
 
-def _sum_zpe(
-    terms: list[dict],
-    states: dict[str, State],
-    normalization_value: float,
-) -> tuple[float, str]:
-    """Compute stoichiometry-weighted ZPE contribution and equation text."""
-    if not terms:
-        return 0.0, "0"
+    if not equations:
+        return energy_total, zpe_total, None, None
+    return energy_total, zpe_total, " + ".join(energy_pieces), " + ".join(zpe_pieces)
 
-    total = 0.0
-    pieces: list[str] = []
 
-    for term in terms:
-        name = term.get("name")
-        stoich = term.get("stoichiometry", 1)
+def _validate_term_names(network_data: dict, states: dict[str, State]) -> None:
+    """Check once that every term of every network step names a loaded state."""
+    for step in network_data.get("network", []):
+        if step.get("type", "surf") == "surf":
+            blocks = [
+                step.get("forward", {}).get("ts", []),
+                step.get("forward", {}).get("is", []),
+                step.get("backward", {}).get("ts", []),
+                step.get("backward", {}).get("is", []),
+            ]
+        else:
+            blocks = [step.get("fs", []), step.get("is", [])]
+
+        for terms in blocks:
+            for term in terms:
+                name = term.get("name")
+                if name not in states:
+                    step_name = step.get("name", "unnamed_step")
+                    raise ValueError(
+                        f"Unknown state '{name}' referenced in network step '{step_name}'"
+                    )
 
-        if name not in states:
-            raise ValueError(f"Unknown state '{name}' referenced in network step")
 
+def _parse_normalization(data: dict) -> float:
+    """Return the validated, non-zero ``normalization`` value of a step block."""
+    normalization = data.get("normalization", 1)
+    if type(normalization) in _NUMBER_TYPES:
+        normalization_value = normalization
+    else:
         try:
-            stoich_value = float(stoich)
+            normalization_value = float(normalization)
         except (TypeError, ValueError) as exc:
-            raise ValueError(f"Invalid stoichiometry for state '{name}': {stoich}") from exc
-
-        zpe_term = stoich_value * states[name].zpe_energy
-        if states[name].paired_modes_averaged:
-            pieces.append(f"{stoich_value:g}*ZPE({name})")
-        else:
-            zpe_term /= normalization_value
-            pieces.append(f"({stoich_value:g}*ZPE({name})/{normalization_value:g})")
+            raise ValueError(f"Invalid normalization value: {normalization}") from exc
 
-        total += zpe_term
+    if normalization_value == 0:
+        raise ValueError("Normalization cannot be zero")
 
-    return total, " + ".join(pieces)
+    return normalization_value
 
 
-def _compute_barrier(
-    direction_data: dict,
+def _compute_energy_difference(
+    upper_terms: list[dict],
+    lower_terms: list[dict],
+    normalization_value: float,
     states: dict[str, State],
-) -> tuple[float, float, float, str]:
-    """Compute electronic, ZPE, and total barrier terms for one direction."""
-    ts_energy, ts_energy_expr = _sum_energy(direction_data.get("ts", []), states)
-    is_energy, is_energy_expr = _sum_energy(direction_data.get("is", []), states)
+    equations: bool = True,
+) -> tuple[float, float, float, str | None]:
+    """Compute electronic, ZPE, and total energy of ``upper`` relative to ``lower``.
 
-    normalization = direction_data.get("normalization", 1)
-    try:
-        normalization_value = float(normalization)
-    except (TypeError, ValueError) as exc:
-        raise ValueError(f"Invalid normalization value: {normalization}") from exc
+    The equation text is only formatted when ``equations`` is ``True``;
+    otherwise ``None`` is returned in its place.
+    """
+    upper_energy, upper_zpe, upper_energy_expr, upper_zpe_expr = _accumulate(
+        upper_terms, states, normalization_value, equations
+    )
+    lower_energy, lower_zpe, lower_energy_expr, lower_zpe_expr = _accumulate(
+        lower_terms, states, normalization_value, equations
+    )
 
-    if normalization_value == 0:
-        raise ValueError("Normalization cannot be zero")
+    electronic = (upper_energy - lower_energy) / normalization_value
+    zpe_correction = upper_zpe - lower_zpe
+    total = electronic + zpe_correction
+
+    if not equations:
+        return electronic, zpe_correction, total, None
 
-    electronic_barrier = (ts_energy - is_energy) / normalization_value
     electronic_equation = (
-        f"({ts_energy_expr} - ({is_energy_expr})) / {normalization_value:g}"
+        f"({upper_energy_expr} - ({lower_energy_expr})) / {normalization_value:g}"
     )
 
-    ts_zpe, ts_zpe_expr = _sum_zpe(direction_data.get("ts", []), states, normalization_value)
-    is_zpe, is_zpe_expr = _sum_zpe(direction_data.get("is", []), states, normalization_value)
+    zpe_equation = f"({upper_zpe_expr} - ({lower_zpe_expr}))"
 
-    zpe_correction = ts_zpe - is_zpe
-    zpe_equation = f"({ts_zpe_expr} - ({is_zpe_expr}))"
-
-    total_barrier = electronic_barrier + zpe_correction
     full_equation = (
         f"E_el: {electronic_equation}; "
         f"ZPE corr: {zpe_equation}; "
         f"Total: ({electronic_equation}) + ({zpe_equation})"
     )
 
-    return electronic_barrier, zpe_correction, total_barrier, full_equation
+    return electronic, zpe_correction, total, full_equation
 
 
-def _compute_adsorption_heat(
-    step_data: dict,
+def _compute_barrier(
+    direction_data: dict,
     states: dict[str, State],
-) -> tuple[float, float, float, str]:
-    """Compute electronic and ZPE-corrected heat for an adsorption step."""
-    fs_energy, fs_energy_expr = _sum_energy(step_data.get("fs", []), states)
-    is_energy, is_energy_expr = _sum_energy(step_data.get("is", []), states)
-
-    normalization = step_data.get("normalization", 1)
-    try:
-        normalization_value = float(normalization)
-    except (TypeError, ValueError) as exc:
-        raise ValueError(f"Invalid normalization value: {normalization}") from exc
-
-    if normalization_value == 0:
-        raise ValueError("Normalization cannot be zero")
-
-    electronic_heat = (fs_energy - is_energy) / normalization_value
-    electronic_equation = (
-        f"({fs_energy_expr} - ({is_energy_expr})) / {normalization_value:g}"
+    equations: bool = True,
+) -> tuple[float, float, float, str | None]:
+    """Compute electronic, ZPE, and total barrier terms for one direction."""
+    return _compute_energy_difference(
+        direction_data.get("ts", []),
+        direction_data.get("is", []),
+        _parse_normalization(direction_data),
+        states,
+        equations,
     )
 
-    fs_zpe, fs_zpe_expr = _sum_zpe(step_data.get("fs", []), states, normalization_value)
-    is_zpe, is_zpe_expr = _sum_zpe(step_data.get("is", []), states, normalization_value)
-
-    zpe_correction = fs_zpe - is_zpe
-    zpe_equation = f"({fs_zpe_expr} - ({is_zpe_expr}))"
 
-    total_heat = electronic_heat + zpe_correction
-    full_equation = (
-        f"E_el: {electronic_equation}; "
-        f"ZPE corr: {zpe_equation}; "
-        f"Total: ({electronic_equation}) + ({zpe_equation})"
+def _compute_adsorption_heat(
+    step_data: dict,
+    states: dict[str, State],
+    equations: bool = True,
+) -> tuple[float, float, float, str | None]:
+    """Compute electronic and ZPE-corrected heat for an adsorption step."""
+    return _compute_energy_difference(
+        step_data.get("fs", []),
+        step_data.get("is", []),
+        _parse_normalization(step_data),
+        states,
+        equations,
     )
 
-    return electronic_heat, zpe_correction, total_heat, full_equation
-
 
 def _compute_rearrangement_energy(
     step_data: dict,
     states: dict[str, State],
-) -> tuple[float, float, float, str]:
+    equations: bool = True,
+) -> tuple[float, float, float, str | None]:
     """Compute electronic and ZPE-corrected energy for a rearrangement step."""
-    fs_energy, fs_energy_expr = _sum_energy(step_data.get("fs", []), states)
-    is_energy, is_energy_expr = _sum_energy(step_data.get("is", []), states)
-
-    normalization = step_data.get("normalization", 1)
-    try:
-        normalization_value = float(normalization)
-    except (TypeError, ValueError) as exc:
-        raise ValueError(f"Invalid normalization value: {normalization}") from exc
-
-    if normalization_value == 0:
-        raise ValueError("Normalization cannot be zero")
-
-    electronic_energy = (fs_energy - is_energy) / normalization_value
-    electronic_equation = (
-        f"({fs_energy_expr} - ({is_energy_expr})) / {normalization_value:g}"
-    )
-
-    fs_zpe, fs_zpe_expr = _sum_zpe(step_data.get("fs", []), states, normalization_value)
-    is_zpe, is_zpe_expr = _sum_zpe(step_data.get("is", []), states, normalization_value)
-
-    zpe_correction = fs_zpe - is_zpe
-    zpe_equation = f"({fs_zpe_expr} - ({is_zpe_expr}))"
-
-    total_energy = electronic_energy + zpe_correction
-    full_equation = (
-        f"E_el: {electronic_equation}; "
-        f"ZPE corr: {zpe_equation}; "
-        f"Total: ({electronic_equation}) + ({zpe_equation})"
+    return _compute_energy_difference(
+        step_data.get("fs", []),
+        step_data.get("is", []),
+        _parse_normalization(step_data),
+        states,
+        equations,
     )
 
-    return electronic_energy, zpe_correction, total_energy, full_equation
 
-
-def _validate_surface_ts_consistency(step: dict) -> None:
+def _validate_surface_ts_consistency(
+    step_name: str,
+    forward_ts: list[dict],
+    backward_ts: list[dict],
+) -> None:
     """Validate that single-term forward/backward TS definitions match."""
-    step_name = step.get("name", "unnamed_step")
-    forward_ts = step.get("forward", {}).get("ts", [])
-    backward_ts = step.get("backward", {}).get("ts", [])
-
     if len(forward_ts) == 1 and len(backward_ts) == 1:
         forward_name = forward_ts[0].get("name")
         backward_name = backward_ts[0].get("name")
@@ -362,11 +476,11 @@ def _validate_surface_ts_consistency(step: dict) -> None:
             )
 
 
-def _extract_shared_surface_ts_name(step: dict) -> str | None:
+def _extract_shared_surface_ts_name(
+    forward_ts: list[dict],
+    backward_ts: list[dict],
+) -> str | None:
     """Return the TS name that appears in both forward/backward ``ts`` entries."""
-    forward_ts = step.get("forward", {}).get("ts", [])
-    backward_ts = step.get("backward", {}).get("ts", [])
-
     forward_names = {term.get("name") for term in forward_ts if term.get("name")}
     backward_names = {term.get("name") for term in backward_ts if term.get("name")}
     shared_names = forward_names.intersection(backward_names)
@@ -376,11 +490,34 @@ def _extract_shared_surface_ts_name(step: dict) -> str | None:
     return next(iter(shared_names))
 
 
-def read_network(network_file: str | Path) -> list[ElementaryStep]:
-    """Parse a network YAML file into evaluated elementary-step objects."""
+def read_network(
+    network_file: str | Path,
+    *,
+    equations: bool = True,
+) -> list[ElementaryStep]:
+    """Parse a network YAML file into evaluated elementary-step objects.
+
+    When ``equations`` is ``False`` the symbolic forward/reverse equation
+    strings are not formatted and the corresponding fields are ``None``.
+    """
+    _, steps = _parse_network(network_file, equations=equations)
+    return steps
+
+
+def _parse_network(
+    network_file: str | Path,
+    *,
+    equations: bool = True,
+) -> tuple[dict, list[ElementaryStep]]:
+    """Load a network file once and evaluate its elementary steps.
+
+    Returns the raw network mapping alongside the steps so callers that also
+    need the ``paths`` section do not read the network file a second time.
+    """
     network_path, network_data = _read_network_yaml(network_file)
 
     states = _load_states(network_data, network_path.parent)
+    _validate_term_names(network_data, states)
 
     steps: list[ElementaryStep] = []
     for step in network_data.get("network", []):
@@ -396,31 +533,35 @@ def read_network(network_file: str | Path) -> list[ElementaryStep]:
                 forward_zpe,
                 forward_total,
                 forward_eq,
-            ) = _compute_adsorption_heat(step, states)
+            ) = _compute_adsorption_heat(step, states, equations)
             reverse_el = 0.0
             reverse_zpe = 0.0
             reverse_total = 0.0
-            reverse_eq = "N/A"
+            reverse_eq = "N/A" if equations else None
             reaction_heat_el = forward_el
             reaction_heat_zpe = forward_zpe
             reaction_heat_total = forward_total
         elif step_type == "surf":
-            _validate_surface_ts_consistency(step)
             forward_data = step.get("forward", {})
             backward_data = step.get("backward", {})
+            _validate_surface_ts_consistency(
+                step.get("name", "unnamed_step"),
+                forward_data.get("ts", []),
+                backward_data.get("ts", []),
+            )
 
             (
                 forward_el,
                 forward_zpe,
                 forward_total,
                 forward_eq,
-            ) = _compute_barrier(forward_data, states)
+            ) = _compute_barrier(forward_data, states, equations)
             (
                 reverse_el,
                 reverse_zpe,
                 reverse_total,
                 reverse_eq,
-            ) = _compute_barrier(backward_data, states)
+            ) = _compute_barrier(backward_data, states, equations)
             reaction_heat_el = forward_el - reverse_el
             reaction_heat_zpe = forward_zpe - reverse_zpe
             reaction_heat_total = forward_total - reverse_total
@@ -430,11 +571,11 @@ def read_network(network_file: str | Path) -> list[ElementaryStep]:
                 forward_zpe,
                 forward_total,
                 forward_eq,
-            ) = _compute_rearrangement_energy(step, states)
+            ) = _compute_rearrangement_energy(step, states, equations)
             reverse_el = -forward_el
             reverse_zpe = -forward_zpe
             reverse_total = -forward_total
-            reverse_eq = f"-({forward_eq})"
+            reverse_eq = f"-({forward_eq})" if equations else None
             reaction_heat_el = forward_el
             reaction_heat_zpe = forward_zpe
             reaction_heat_total = forward_total
@@ -458,14 +599,41 @@ def read_network(network_file: str | Path) -> list[ElementaryStep]:
             )
         )
 
-    return steps
+    return network_data, steps
+
+
+def _resolve_path_steps(
+    path: dict,
+    path_name: str,
+    steps_by_name: dict[str, ElementaryStep],
+) -> list[tuple[ElementaryStep, float, dict]]:
+    """Map the ``steps`` of one path entry to evaluated steps and factors.
+
+    Returns ``(step, factor, path_step)`` tuples in path order, where
+    ``path_step`` is the raw path entry (e.g. for its ``label``).
+    """
+    resolved: list[tuple[ElementaryStep, float, dict]] = []
+    for path_step in path.get("steps", []):
+        step_name = path_step.get("name")
+        if step_name not in steps_by_name:
+            raise ValueError(f"Unknown step '{step_name}' referenced in path '{path_name}'")
+
+        factor = path_step.get("factor", 1)
+        try:
+            factor_value = float(factor)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(
+                f"Invalid factor for step '{step_name}' in path '{path_name}': {factor}"
+            ) from exc
+
+        resolved.append((steps_by_name[step_name], factor_value, path_step))
+
+    return resolved
 
 
 def evaluate_paths(network_file: str | Path) -> list[ReactionPath]:
     """Calculate net reaction energies for each named pathway in a network."""
-    _, network_data = _read_network_yaml(network_file)
-
-    steps = read_network(network_file)
+    network_data, steps = _parse_network(network_file, equations=False)
     steps_by_name = {step.name: step for step in steps}
 
     paths: list[ReactionPath] = []
@@ -475,21 +643,8 @@ def evaluate_paths(network_file: str | Path) -> list[ReactionPath]:
             raise ValueError(f"Invalid path entry without a name: {path}")
 
         total_reaction_energy = 0.0
-        for path_step in path.get("steps", []):
-            step_name = path_step.get("name")
-            if step_name not in steps_by_name:
-                raise ValueError(f"Unknown step '{step_name}' referenced in path '{path_name}'")
-
-            factor = path_step.get("factor", 1)
-            try:
-                factor_value = float(factor)
-            except (TypeError, ValueError) as exc:
-                raise ValueError(
-                    f"Invalid factor for step '{step_name}' in path '{path_name}': {factor}"
-                ) from exc
-
-            step_heat = steps_by_name[step_name].reaction_heat_total
-            total_reaction_energy += factor_value * step_heat
+        for step, factor_value, _ in _resolve_path_steps(path, path_name, steps_by_name):
+            total_reaction_energy += factor_value * step.reaction_heat_total
 
         paths.append(
             ReactionPath(
@@ -513,6 +668,7 @@ def build_fnf(
     """Build a formatted-network-file (FNF) payload from a network YAML file."""
     network_path, network_data = _read_network_yaml(network_file)
     states = _load_states(network_data, network_path.parent)
+    _validate_term_names(network_data, states)
 
     stable_states = network_data.get("stable_states", [])
     state_phase: dict[str, str] = {
@@ -557,10 +713,12 @@ def build_fnf(
         }
 
         if step_type == "surf":
-            _validate_surface_ts_consistency(step)
             forward_data = step.get("forward", {})
             backward_data = step.get("backward", {})
-            shared_ts_name = _extract_shared_surface_ts_name(step)
+            forward_ts = forward_data.get("ts", [])
+            backward_ts = backward_data.get("ts", [])
+            _validate_surface_ts_consistency(edge["name"], forward_ts, backward_ts)
+            shared_ts_name = _extract_shared_surface_ts_name(forward_ts, backward_ts)
 
             forward_is = forward_data.get("is", [])
             backward_is = backward_data.get("is", [])
@@ -572,8 +730,8 @@ def build_fnf(
                     f"Surface step '{edge['name']}' must map to at least two nodes"
                 )
 
-            _, _, forward_total, _ = _compute_barrier(forward_data, states)
-            _, _, backward_total, _ = _compute_barrier(backward_data, states)
+            _, _, forward_total, _ = _compute_barrier(forward_data, states, equations=False)
+            _, _, backward_total, _ = _compute_barrier(backward_data, states, equations=False)
 
             split_nodes = _split_edge_nodes(reactant_nodes, product_nodes) if split else None
             if split_nodes:
@@ -608,7 +766,7 @@ def build_fnf(
             ):
                 edge["structure"] = transition_structures[shared_ts_name]
         elif step_type == "ads":
-            _, _, adsorption_total, _ = _compute_adsorption_heat(step, states)
+            _, _, adsorption_total, _ = _compute_adsorption_heat(step, states, equations=False)
 
             is_names = list(dict.fromkeys(
                 term["name"]
@@ -644,7 +802,7 @@ def build_fnf(
             edge["nodes"] = filtered_nodes
             edge["ads"] = float(_convert_energy_unit(adsorption_total, unit))
         else:
-            _, _, rearrangement_total, _ = _compute_rearrangement_energy(step, states)
+            _, _, rearrangement_total, _ = _compute_rearrangement_energy(step, states, equations=False)
 
             is_names = list(dict.fromkeys(term["name"] for term in step.get("is", [])))
             fs_names = list(dict.fromkeys(term["name"] for term in step.get("fs", [])))
@@ -708,14 +866,14 @@ def build_ped(
         Image output path. When ``None``, the plot is displayed interactively.
     """
 
-    import numpy as np
     import matplotlib.pyplot as plt
+    import numpy as np
 
-    network_path = Path(network_file).resolve()
-    with network_path.open("r", encoding="utf-8") as stream:
-        network_data = yaml.safe_load(stream) or {}
+    # Normalised abscissa u = (x - x_peak) / h for the transition-state
+    # parabolas; a dashed connector does not need more points than this.
+    parabola_u = np.linspace(-1.0, 1.0, 24)
 
-    steps = read_network(network_file)
+    network_data, steps = _parse_network(network_file, equations=False)
     steps_by_name = {step.name: step for step in steps}
 
     selected_path = None
@@ -727,22 +885,13 @@ def build_ped(
     if selected_path is None:
         raise ValueError(f"Path '{path_name}' not found in network file")
 
-    condensed_steps: list[tuple[ElementaryStep, float, str]] = []
-    for index, path_step in enumerate(selected_path.get("steps", []), start=1):
-        step_name = path_step.get("name")
-        if step_name not in steps_by_name:
-            raise ValueError(f"Unknown step '{step_name}' referenced in path '{path_name}'")
-
-        factor = path_step.get("factor", 1)
-        try:
-            factor_value = float(factor)
-        except (TypeError, ValueError) as exc:
-            raise ValueError(
-                f"Invalid factor for step '{step_name}' in path '{path_name}': {factor}"
-            ) from exc
-
-        label = str(path_step.get("label", f"state_{index}"))
-        condensed_steps.append((steps_by_name[step_name], factor_value, label))
+    condensed_steps: list[tuple[ElementaryStep, float, str]] = [
+        (step, factor_value, str(path_step.get("label", f"state_{index}")))
+        for index, (step, factor_value, path_step) in enumerate(
+            _resolve_path_steps(selected_path, path_name, steps_by_name),
+            start=1,
+        )
+    ]
 
     fig, ax = plt.subplots(figsize=(10, 7))
 
@@ -788,15 +937,12 @@ def build_ped(
             x_end = x_cursor + connector_width
             x_peak = 0.5 * (x_start + x_end)
 
-            x_parabola = np.linspace(x_start, x_end, 120)
-            a = np.array([
-                [x_start**2, x_start, 1.0],
-                [x_peak**2, x_peak, 1.0],
-                [x_end**2, x_end, 1.0],
-            ])
-            b = np.array([current_energy, ts_energy, final_energy])
-            coef = np.linalg.solve(a, b)
-            y_parabola = coef[0] * x_parabola**2 + coef[1] * x_parabola + coef[2]
+            # Parabola through (x_start, E_is), (x_peak, E_ts), (x_end, E_fs)
+            # written around the vertex abscissa with u = (x - x_peak) / h.
+            x_parabola = x_peak + (0.5 * connector_width) * parabola_u
+            slope = 0.5 * (final_energy - current_energy)
+            curvature = 0.5 * (current_energy - 2.0 * ts_energy + final_energy)
+            y_parabola = ts_energy + slope * parabola_u + curvature * parabola_u**2
             ax.plot(
                 x_parabola,
                 y_parabola,
@@ -891,6 +1037,10 @@ def build_ped(
         plt.show()
 
 
+# Element counts following a symbol, ``*`` or closing parenthesis.
+_SUBSCRIPT_RE = re.compile(r"(?<=[A-Za-z*\)])(\d+)")
+
+
 def _format_chemical_subscripts(label: str) -> str:
     """Format stoichiometric digits as mathtext subscripts for plotting.
 
@@ -905,4 +1055,4 @@ def _format_chemical_subscripts(label: str) -> str:
         Label with element-count digits converted to subscripts.
     """
 
-    return re.sub(r"(?<=[A-Za-z*\)])(\d+)", r"$_{\1}$", label)
+    return _SUBSCRIPT_RE.sub(r"$_{\1}$", label)
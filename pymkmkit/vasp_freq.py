@@ -1,11 +1,15 @@
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import copy
+import io
+import mmap
 import re
 import json
 import numpy as np
 from ase import Atoms
-from ase.io import read
-from ase.io.formats import UnknownFileTypeError
-from ase.io import ParseError
+from ase.data import chemical_symbols
 from pymkmkit.yaml_writer import InlineList
 from pymkmkit._version import get_version
 from datetime import datetime, timezone
@@ -35,6 +39,26 @@ IMPORTANT_KEYS = {
     "ALGO": str,
 }
 
+# ``KEY = value`` at the start of a line; the key must match exactly so that
+# e.g. ``EDIFFG`` or ``GGA_COMPAT`` do not overwrite ``EDIFF`` or ``GGA``.
+# Only the first value token is captured; units and comments are dropped.
+_INCAR_RE = re.compile(
+    r"^[ \t]*(" + "|".join(map(re.escape, IMPORTANT_KEYS)) + r")[ \t]*=[ \t]*([^\s=]+)",
+    re.MULTILINE,
+)
+# Cheap C-level prefix test run before ``_INCAR_RE`` on streamed lines.
+_INCAR_KEY_PREFIXES = tuple(IMPORTANT_KEYS)
+
+# Banner of the first electronic iteration; the INCAR and LDA+U echoes are
+# all printed before it.
+_PARAMETERS_END = "- Iteration"
+
+
+def _parameters_end(text):
+    """Return the offset where the parameter echo of an OUTCAR ends."""
+    end = text.find(_PARAMETERS_END)
+    return end if end >= 0 else len(text)
+
 
 def _parse_bool_token(value):
     token = value.strip().split()[0].strip(";").upper()
@@ -46,8 +70,12 @@ def _parse_bool_token(value):
 
 
 def _clean_value(value, cast):
-    """Strip units/comments and cast to desired type."""
-    value = value.split()[0].replace(";", "")
+    """Strip ``;`` separators from a value token and cast to desired type.
+
+    ``_INCAR_RE`` already captures only the first token after ``=``, so
+    trailing units and comments never reach this function.
+    """
+    value = value.replace(";", "")
     try:
         return cast(value)
     except Exception:
@@ -69,14 +97,9 @@ def extract_incar_settings(text):
     """
     incar = {}
 
-    for line in text.splitlines():
-        stripped = line.strip()
-
-        for key, cast in IMPORTANT_KEYS.items():
-            if stripped.startswith(key):
-                parts = stripped.split("=")
-                if len(parts) > 1:
-                    incar[key] = _clean_value(parts[1], cast)
+    for match in _INCAR_RE.finditer(text, 0, _parameters_end(text)):
+        key = match.group(1)
+        incar[key] = _clean_value(match.group(2), IMPORTANT_KEYS[key])
 
     return incar
 
@@ -91,73 +114,104 @@ def _parse_array_values(value, cast):
     return values
 
 
-def extract_hubbard_u_settings(text):
-    """Extract LDA+U settings from OUTCAR text."""
-    hubbard = {
-        "LDAU": None,
-        "LDAUL": None,
-        "LDAUU": None,
-        "LDAUJ": None,
-    }
+_HUBBARD_KEYS = ("LDAU", "LDAUL", "LDAUU", "LDAUJ")
 
-    for line in text.splitlines():
-        stripped = line.strip()
 
-        if stripped.startswith("LDAU") and "=" in stripped:
-            key, raw = [part.strip() for part in stripped.split("=", 1)]
+def _apply_hubbard_line(hubbard, line):
+    """Update ``hubbard`` in place from an ``LDAU*`` OUTCAR line."""
+    stripped = line.strip()
+
+    if stripped.startswith("LDAU") and "=" in stripped:
+        key, raw = [part.strip() for part in stripped.split("=", 1)]
 
-            if key == "LDAU":
-                hubbard["LDAU"] = _parse_bool_token(raw)
-            elif key == "LDAUL":
-                hubbard["LDAUL"] = _parse_array_values(raw, int)
-            elif key == "LDAUU":
-                hubbard["LDAUU"] = _parse_array_values(raw, float)
-            elif key == "LDAUJ":
-                hubbard["LDAUJ"] = _parse_array_values(raw, float)
+        if key == "LDAU":
+            hubbard["LDAU"] = _parse_bool_token(raw)
+        elif key == "LDAUL":
+            hubbard["LDAUL"] = _parse_array_values(raw, int)
+        elif key == "LDAUU":
+            hubbard["LDAUU"] = _parse_array_values(raw, float)
+        elif key == "LDAUJ":
+            hubbard["LDAUJ"] = _parse_array_values(raw, float)
 
+
+def _finalize_hubbard(hubbard):
+    """Return ``None`` when no LDA+U tag was found."""
     if all(value is None for value in hubbard.values()):
         return None
 
     return hubbard
 
 
+def extract_hubbard_u_settings(text):
+    """Extract LDA+U settings from OUTCAR text."""
+    hubbard = dict.fromkeys(_HUBBARD_KEYS)
+
+    for line in text[:_parameters_end(text)].splitlines():
+        _apply_hubbard_line(hubbard, line)
+
+    return _finalize_hubbard(hubbard)
+
+
 # ============================================================
 # POTCAR extraction (unique entries, preserve order)
 # ============================================================
 
+def _potcar_entry(line):
+    """Return the POTCAR descriptor on an OUTCAR line, or ``None``."""
+    if "POTCAR:" not in line:
+        return None
+    return line.split("POTCAR:")[1].strip()
+
+
+# All ``POTCAR:`` lines are printed in the OUTCAR header, before this line.
+_POTCAR_HEADER_END = "ions per type"
+
+
 def extract_potcar_info(text):
     """Extract unique POTCAR descriptors from OUTCAR text."""
-    pots = []
+    header_end = text.find(_POTCAR_HEADER_END)
+    if header_end >= 0:
+        text = text[:header_end]
+
+    # dict keys keep first-seen order with O(1) membership tests
+    pots = {}
 
     for line in text.splitlines():
-        if "POTCAR:" in line:
-            entry = line.split("POTCAR:")[1].strip()
-            if entry not in pots:
-                pots.append(entry)
+        entry = _potcar_entry(line)
+        if entry is not None:
+            pots[entry] = None
+
+    return list(pots)
+
 
-    return pots
+_VASP_VERSION_RE = re.compile(r"\bvasp\.([0-9][0-9A-Za-z_.-]*)", re.IGNORECASE)
+_EXECUTED_AT_RE = re.compile(
+    r"executed\s+on.*?date\s+(\d{4}\.\d{2}\.\d{2})\s+(\d{2}:\d{2}:\d{2})",
+    re.IGNORECASE,
+)
 
 
 def extract_vasp_version(text):
     """Extract the VASP version string from OUTCAR text."""
-    match = re.search(r"\bvasp\.([0-9][0-9A-Za-z_.-]*)", text, flags=re.IGNORECASE)
+    match = _VASP_VERSION_RE.search(text)
     if match:
         return match.group(1)
     return None
 
 
+def _format_execution_timestamp(match):
+    """Format an ``_EXECUTED_AT_RE`` match as ``YYYY-MM-DDThh:mm:ssZ``."""
+    date_part, time_part = match.groups()
+    return f"{date_part.replace('.', '-')}T{time_part}Z"
+
+
 def extract_execution_timestamp(text):
     """Extract the VASP execution date-time from OUTCAR text in UTC-like format."""
-    match = re.search(
-        r"executed\s+on.*?date\s+(\d{4}\.\d{2}\.\d{2})\s+(\d{2}:\d{2}:\d{2})",
-        text,
-        flags=re.IGNORECASE,
-    )
+    match = _EXECUTED_AT_RE.search(text)
     if not match:
         return None
 
-    date_part, time_part = match.groups()
-    return f"{date_part.replace('.', '-')}T{time_part}Z"
+    return _format_execution_timestamp(match)
 
 
 # ============================================================
@@ -166,32 +220,80 @@ def extract_execution_timestamp(text):
 
 
 
-def extract_ionic_energies(text):
-    """Extract ionic-step electronic energies from OUTCAR text."""
-    energies = []
+_FLOAT = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[Ee][-+]?\d+)?"
 
-    for line in text.splitlines():
-        if "energy  without entropy=" in line and "energy(sigma->0)" in line:
-            try:
-                energies.append(float(line.split("=")[-1].strip()))
-            except ValueError:
-                continue
+# ``energy  without entropy=  -802.1  energy(sigma->0) =  -802.2``
+_IONIC_ENERGY_RE = re.compile(
+    r"energy  without entropy=[^\n]*energy\(sigma->0\)[ \t]*=[ \t]*(" + _FLOAT + r")[ \t]*$",
+    re.MULTILINE,
+)
+# ``free  energy   TOTEN  =  -802.3 eV``
+_TOTAL_ENERGY_RE = re.compile(
+    r"free  energy   TOTEN[ \t]*=[ \t]*(" + _FLOAT + r")(?=\s|$)",
+    re.MULTILINE,
+)
+
+
+def _ionic_energy(line):
+    """Return the ``energy(sigma->0)`` value on an OUTCAR line, or ``None``."""
+    if "energy  without entropy=" in line:
+        match = _IONIC_ENERGY_RE.search(line)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _total_energy(line):
+    """Return the ``free  energy   TOTEN`` value on an OUTCAR line, or ``None``."""
+    if "free  energy   TOTEN" in line:
+        match = _TOTAL_ENERGY_RE.search(line)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _float_list(values):
+    """Convert a list of numeric strings to Python floats in one NumPy call."""
+    return np.array(values, dtype=np.float64).tolist()
 
-    return energies
+
+def extract_ionic_energies(text):
+    """Extract ionic-step electronic energies from OUTCAR text."""
+    return _float_list(_IONIC_ENERGY_RE.findall(text))
 
 
 def extract_total_energies(text):
     """Extract free energies (TOTEN) from OUTCAR text."""
-    energies = []
+    return _float_list(_TOTAL_ENERGY_RE.findall(text))
 
-    for line in text.splitlines():
-        if "free  energy   TOTEN" in line:
-            try:
-                energies.append(float(line.split("=")[-1].split()[0]))
-            except ValueError:
-                continue
 
-    return energies
+_INT_RE = re.compile(r"\d+")
+# Splits fixed-width columns that touch, e.g. ``-7.748433682-13.420680816``.
+_FLOAT_RE = re.compile(_FLOAT)
+
+
+_KNOWN_SYMBOLS = frozenset(chemical_symbols[1:])
+
+# Element part of a POTCAR name: ``Ni_pv``, ``O_s``, ``H1.25``, ``Fe/``.
+_POTCAR_ELEMENT_RE = re.compile(r"[A-Za-z]+")
+
+
+def _potcar_symbol(titel_line):
+    """Return the element symbol named on a POTCAR ``TITEL`` line.
+
+    ``TITEL  = PAW_PBE Ni_pv 06Sep2000`` yields ``Ni``: the POTCAR variant
+    suffix (``_pv``, ``_s``, ``_sv``, ``_GW``, ...), any ``.``/``/`` part and
+    the date are dropped. Raises ``ValueError`` for an unknown element
+    rather than guessing (``O_s`` must not become osmium).
+    """
+    tokens = titel_line.split("=", 1)[-1].split()
+    name = tokens[1] if len(tokens) > 1 else (tokens[0] if tokens else "")
+    match = _POTCAR_ELEMENT_RE.match(name)
+    symbol = match.group(0).capitalize() if match else ""
+
+    if symbol not in _KNOWN_SYMBOLS:
+        raise ValueError(f"Unknown element in POTCAR TITEL line: {titel_line.strip()!r}")
+    return symbol
 
 
 def _parse_atomic_symbols(text):
@@ -201,24 +303,14 @@ def _parse_atomic_symbols(text):
 
     for line in text.splitlines():
         if "ions per type" in line:
-            counts = [int(x) for x in re.findall(r"\d+", line)]
+            counts = [int(x) for x in _INT_RE.findall(line)]
         elif "TITEL" in line:
-            parts = line.split()
-            for part in reversed(parts):
-                cleaned = part.strip("_.,")
-                if cleaned and cleaned[0].isalpha():
-                    symbol = ''.join(ch for ch in cleaned if ch.isalpha())
-                    if symbol:
-                        symbols.append(symbol.capitalize())
-                    break
+            symbols.append(_potcar_symbol(line))
 
     if not counts or not symbols:
         raise ValueError("Could not parse species metadata from OUTCAR")
 
-    unique_symbols = []
-    for symbol in symbols:
-        if symbol not in unique_symbols:
-            unique_symbols.append(symbol)
+    unique_symbols = list(dict.fromkeys(symbols))
 
     if len(unique_symbols) < len(counts):
         raise ValueError("Insufficient POTCAR species entries for ions per type")
@@ -230,53 +322,155 @@ def _parse_atomic_symbols(text):
     return expanded
 
 
-def _parse_last_lattice_vectors(lines):
-    """Parse the final reported lattice vectors from OUTCAR lines."""
-    for i in range(len(lines) - 1, -1, -1):
-        if "direct lattice vectors" in lines[i]:
-            vectors = []
-            for j in range(i + 1, i + 4):
-                parts = lines[j].split()
-                vectors.append([float(parts[0]), float(parts[1]), float(parts[2])])
-            return vectors
+def _rows_after_last(text, marker, count, skip=0):
+    """Parse the ``count`` lines after the last ``marker`` line as 3-vectors.
+
+    The marker is located with ``str.rfind`` so only the tail of the OUTCAR
+    is touched; ``skip`` lines (e.g. a ``----`` rule) directly below the
+    marker are ignored. All numbers in the block are tokenized with one
+    regex pass (which also separates fixed-width columns without a blank
+    between them) and converted in a single NumPy call; the first three
+    columns are returned as a ``(count, 3)`` array. Returns ``None`` when
+    ``marker`` does not occur.
+    """
+    pos = text.rfind(marker)
+    if pos < 0:
+        return None
+
+    start = text.find("\n", pos) + 1
+    for _ in range(skip):
+        if start == 0:
+            break
+        start = text.find("\n", start) + 1
+
+    end = start
+    for _ in range(count):
+        if end == 0 or end >= len(text):
+            raise ValueError(f"Truncated block after '{marker}' in OUTCAR")
+        end = text.find("\n", end) + 1
+
+    values = np.array(_FLOAT_RE.findall(text, start, end or len(text)), dtype=np.float64)
+    if values.size < 3 * count or values.size % count:
+        raise ValueError(f"Malformed block after '{marker}' in OUTCAR")
 
-    raise ValueError("Could not parse lattice vectors from OUTCAR")
+    return values.reshape(count, -1)[:, :3]
 
 
-def _parse_last_direct_positions(lines, n_atoms):
+def _parse_last_lattice_vectors(text):
+    """Parse the final reported lattice vectors from OUTCAR text."""
+    vectors = _rows_after_last(text, "direct lattice vectors", 3)
+    if vectors is None:
+        raise ValueError("Could not parse lattice vectors from OUTCAR")
+    return vectors
+
+
+def _parse_last_direct_positions(text, n_atoms):
     """Parse final direct (fractional) coordinates for all atoms."""
     marker = "position of ions in fractional coordinates (direct lattice)"
 
-    for i in range(len(lines) - 1, -1, -1):
-        if marker in lines[i]:
-            positions = []
-            for j in range(i + 1, i + 1 + n_atoms):
-                parts = lines[j].split()
-                positions.append([float(parts[0]), float(parts[1]), float(parts[2])])
-            return positions
+    positions = _rows_after_last(text, marker, n_atoms)
+    if positions is None:
+        raise ValueError("Could not parse direct coordinates from OUTCAR")
+    return positions
+
 
-    raise ValueError("Could not parse direct coordinates from OUTCAR")
+# Header of the per-ionic-step ``POSITION  TOTAL-FORCE`` block (Cartesian).
+_POSITIONS_MARKER = "POSITION          "
+
+# Closes every completed ionic step; ASE splits OUTCAR images on this line.
+_IONIC_STEP_END = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM"
+
+
+def _read_final_atoms(outcar_path):
+    """Build the last ionic-step geometry of an OUTCAR without ASE.
+
+    Equivalent to ``ase.io.read(outcar_path)`` for the structure (species,
+    final cell and final Cartesian positions), but the file is
+    memory-mapped and only the species header and the final lattice /
+    ``POSITION`` blocks are decoded, instead of parsing every ionic step.
+    Like ASE, a trailing step without a closing energy block is ignored.
+    """
+    with Path(outcar_path).open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            header_end = mapped.find(_POTCAR_HEADER_END.encode())
+            header_end = mapped.find(b"\n", header_end) if header_end >= 0 else -1
+            step_end = mapped.rfind(_IONIC_STEP_END.encode())
+            cell_at = mapped.rfind(b"direct lattice vectors", 0, step_end)
+            positions_at = mapped.rfind(_POSITIONS_MARKER.encode(), 0, step_end)
+
+            if min(header_end, step_end, cell_at, positions_at) < 0:
+                raise ValueError("Could not locate the final structure in OUTCAR")
+
+            tail_start = mapped.rfind(b"\n", 0, min(cell_at, positions_at)) + 1
+            header = mapped[:header_end].decode(errors="ignore")
+            tail = mapped[tail_start:step_end].decode(errors="ignore")
+
+    symbols = _parse_atomic_symbols(header)
+    cell = _parse_last_lattice_vectors(tail)
+    positions = _rows_after_last(tail, _POSITIONS_MARKER, len(symbols), skip=1)
+
+    return Atoms(symbols=symbols, positions=positions, cell=cell, pbc=True)
 
 
 def _parse_atoms_from_outcar_text(text):
     """Construct an ASE ``Atoms`` object directly from OUTCAR text."""
-    lines = text.splitlines()
     symbols = _parse_atomic_symbols(text)
-    cell = _parse_last_lattice_vectors(lines)
-    scaled_positions = _parse_last_direct_positions(lines, len(symbols))
+    cell = _parse_last_lattice_vectors(text)
+    scaled_positions = _parse_last_direct_positions(text, len(symbols))
 
     atoms = Atoms(symbols=symbols, cell=cell, pbc=True)
     atoms.set_scaled_positions(scaled_positions)
     return atoms
 
 
-def _read_last_optimization_atoms(outcar_path, text):
-    """Read final optimization geometry, with text-parsing fallback."""
+def _read_last_optimization_atoms(outcar_path):
+    """Read final optimization geometry, with text-parsing fallback.
+
+    Both readers take species from ``_parse_atomic_symbols``, which reports
+    missing headers and unknown POTCAR elements as ``ValueError``; the
+    text parser is tried when the final ``POSITION`` block or the closing
+    energy line is missing, and raises the same error for bad species.
+    """
     try:
-        return read(outcar_path, index=-1)
-    except (ParseError, UnknownFileTypeError, KeyError, ValueError):
+        return _read_final_atoms(outcar_path)
+    except ValueError:
+        text = Path(outcar_path).read_text(errors="ignore")
         return _parse_atoms_from_outcar_text(text)
 
+
+_FREQUENCY_ANCHOR = "Eigenvectors and eigenvalues of the dynamical matrix"
+
+# ``   3 f/i=  1.23 THz  7.72 2PiTHz  41.0 cm-1  5.08 meV``: mode index,
+# real/imaginary marker and the rest of the line.
+_FREQUENCY_RE = re.compile(
+    r"^[ \t]*(\d+)[ \t]+f(  |/i)=([^\n]*)",
+    re.MULTILINE,
+)
+
+
+def _wavenumber(fields):
+    """Return the ``cm-1`` value from the tail of a frequency line, if any."""
+    # Fixed VASP layout: ``... <value> cm-1 <value> meV``.
+    tokens = fields.rsplit(None, 4)
+    if len(tokens) == 5 and tokens[2] == "cm-1":
+        try:
+            return float(tokens[1])
+        except ValueError:
+            pass
+
+    match = _CM1_RE.search(fields)
+    return float(match.group(1)) if match else None
+
+
+def _frequency_fields(match):
+    """Convert a ``_FREQUENCY_RE`` match to ``(index, value_cm1, is_imaginary)``."""
+    return (
+        int(match.group(1)),
+        _wavenumber(match.group(3)),
+        match.group(2) == "/i",
+    )
+
+
 def extract_frequencies(text):
     """
     Extract vibrational frequencies from OUTCAR.
@@ -289,36 +483,46 @@ def extract_frequencies(text):
 
     last_index = 0
 
-    for line in text.splitlines():
-        if " f  =" in line or " f/i=" in line:
-            parts = line.split()
+    # VASP prints the mode listing only below this header; without it there
+    # is nothing to find and the (ionic-step) text is not scanned at all.
+    start = text.find(_FREQUENCY_ANCHOR)
+    if start < 0:
+        return real, imaginary
 
-            try:
-                index = int(parts[0])
-            except ValueError:
-                continue
+    for match in _FREQUENCY_RE.finditer(text, start):
+        index, value, is_imaginary = _frequency_fields(match)
 
-            # detect repeated block (index resets)
-            if index <= last_index:
-                break
+        # detect repeated block (index resets)
+        if index <= last_index:
+            break
 
-            last_index = index
+        last_index = index
 
-            match = re.search(r"([-+]?\d*\.?\d+)\s+cm-1", line)
-            if not match:
-                continue
-
-            value = float(match.group(1))
+        if value is None:
+            continue
 
-            if "f/i=" in line:
-                imaginary.append(-abs(value))
-            else:
-                real.append(value)
+        if is_imaginary:
+            imaginary.append(-abs(value))
+        else:
+            real.append(value)
 
     return real, imaginary
 
 
 _DOF_LABEL_RE = re.compile(r"^(\d+)([XYZ])$")
+_CM1_RE = re.compile(r"([-+]?\d*\.?\d+)\s+cm-1")
+
+
+def _lines_from_last(text, marker):
+    """Return the lines of ``text`` starting at the last line containing ``marker``.
+
+    Only the tail of the OUTCAR is split, instead of the whole text. Returns
+    ``None`` when ``marker`` does not occur.
+    """
+    pos = text.rfind(marker)
+    if pos < 0:
+        return None
+    return text[text.rfind("\n", 0, pos) + 1:].splitlines()
 
 
 def extract_perturbed_hessian(text):
@@ -329,18 +533,13 @@ def extract_perturbed_hessian(text):
     tuple[list[str], list[list[float]]] | (None, None)
         DOF labels and Hessian matrix values for the perturbed coordinates.
     """
-    lines = text.splitlines()
-    start = None
-
-    for idx, line in enumerate(lines):
-        if "SECOND DERIVATIVES (NOT SYMMETRIZED)" in line:
-            start = idx
-
-    if start is None:
+    lines = _lines_from_last(text, "SECOND DERIVATIVES (NOT SYMMETRIZED)")
+    if lines is None:
         return None, None
 
-    row_order = []
-    values = {}
+    start = 0
+    row_index = {}
+    blocks = []
     i = start + 1
 
     while i < len(lines):
@@ -362,6 +561,8 @@ def extract_perturbed_hessian(text):
             continue
 
         i += 1
+        block_rows = []
+        block_values = []
         while i < len(lines):
             row_line = lines[i]
 
@@ -378,23 +579,33 @@ def extract_perturbed_hessian(text):
             if len(numbers) != len(labels):
                 raise ValueError("Malformed Hessian block in OUTCAR")
 
-            if row_label not in row_order:
-                row_order.append(row_label)
-                values[row_label] = {}
-
-            for col_label, value in zip(labels, numbers):
-                values[row_label][col_label] = float(value)
+            row_index.setdefault(row_label, len(row_index))
+            block_rows.append(row_label)
+            block_values.append(numbers)
 
             i += 1
 
-    if not row_order:
+        if block_rows:
+            blocks.append((block_rows, labels, block_values))
+
+    if not row_index:
         return None, None
 
-    matrix = [
-        [-values[row][col] for col in row_order]
-        for row in row_order
-    ]
-    return row_order, matrix
+    # Blit each printed column block into a preallocated matrix; the numbers
+    # of a whole block are converted from text in a single NumPy call.
+    hessian = np.full((len(row_index), len(row_index)), np.nan)
+    for rows, cols, block in blocks:
+        kept = [k for k, col in enumerate(cols) if col in row_index]
+        values = np.array(block, dtype=np.float64)[:, kept]
+        hessian[np.ix_(
+            [row_index[row] for row in rows],
+            [row_index[cols[k]] for k in kept],
+        )] = values
+
+    if np.isnan(hessian).any():
+        raise ValueError("Incomplete Hessian block in OUTCAR")
+
+    return list(row_index), (-hessian).tolist()
 
 
 def extract_hessian_from_dynamical_modes(text, atoms):
@@ -404,16 +615,11 @@ def extract_hessian_from_dynamical_modes(text, atoms):
     ``Eigenvectors and eigenvalues of the dynamical matrix`` section
     (and no explicit ``SECOND DERIVATIVES`` block).
     """
-    lines = text.splitlines()
-    start = None
-
-    for idx, line in enumerate(lines):
-        if "Eigenvectors and eigenvalues of the dynamical matrix" in line:
-            start = idx
-
-    if start is None:
+    lines = _lines_from_last(text, _FREQUENCY_ANCHOR)
+    if lines is None:
         return None, None
 
+    start = 0
     n_atoms = len(atoms)
     n_dof = 3 * n_atoms
     factor_cm = 521.4708983725064
@@ -428,7 +634,7 @@ def extract_hessian_from_dynamical_modes(text, atoms):
             i += 1
             continue
 
-        freq_match = re.search(r"([-+]?\d*\.?\d+)\s+cm-1", line)
+        freq_match = _CM1_RE.search(line)
         if not freq_match:
             i += 1
             continue
@@ -470,12 +676,14 @@ def extract_hessian_from_dynamical_modes(text, atoms):
         return None, None
 
     vectors = np.array(eigvecs, dtype=float).T
-    dynamical = vectors @ np.diag(np.array(eigvals, dtype=float)) @ vectors.T
+    # V diag(w) V^T without materialising diag(w)
+    dynamical = (vectors * np.array(eigvals, dtype=float)) @ vectors.T
 
     dof_labels = [f"{i + 1}{axis}" for i in range(n_atoms) for axis in "XYZ"]
-    masses = np.repeat(atoms.get_masses(), 3)
-    mass_factor = np.sqrt(np.outer(masses, masses))
-    hessian = dynamical * mass_factor
+    sqrt_mass = np.sqrt(np.repeat(atoms.get_masses(), 3))
+    hessian = dynamical
+    hessian *= sqrt_mass[:, None]
+    hessian *= sqrt_mass[None, :]
     hessian = 0.5 * (hessian + hessian.T)
 
     return dof_labels, hessian.tolist()
@@ -483,35 +691,35 @@ def extract_hessian_from_dynamical_modes(text, atoms):
 
 def _split_frequencies_from_partial_hessian(dof_labels, hessian_matrix, atoms, tol_cm=1e-3):
     """Recover real and imaginary vibrational frequencies from a partial Hessian."""
-    dof_masses = []
+    atom_indices = []
     for label in dof_labels:
         match = _DOF_LABEL_RE.match(label)
         if not match:
             raise ValueError(f"Invalid DOF label: {label}")
-        atom_index = int(match.group(1)) - 1
-        dof_masses.append(atoms[atom_index].mass)
-
-    hessian = np.array(hessian_matrix, dtype=float)
-    mass = np.sqrt(np.outer(dof_masses, dof_masses))
-    dynamical = hessian / mass
+        atom_indices.append(int(match.group(1)) - 1)
+
+    dof_masses = atoms.get_masses()[atom_indices]
+
+    # Mass-weight rows and columns by broadcasting instead of building and
+    # dividing by the full sqrt(m_i m_j) matrix.
+    inv_sqrt_mass = 1.0 / np.sqrt(dof_masses)
+    # np.array always copies, so the in-place weighting below never touches
+    # a caller-supplied array.
+    dynamical = np.array(hessian_matrix, dtype=float)
+    dynamical *= inv_sqrt_mass[:, None]
+    dynamical *= inv_sqrt_mass[None, :]
+    # eigvalsh returns the eigenvalues in ascending order
     eigenvals = np.linalg.eigvalsh(dynamical)
 
     # Conversion: sqrt(eV/amu)/Ang -> cm-1
     factor_cm = 521.4708983725064
     tol_eig = (tol_cm / factor_cm) ** 2
 
-    real = [
-        float(factor_cm * np.sqrt(value))
-        for value in eigenvals
-        if value > tol_eig
-    ]
-    imaginary = [
-        float(-factor_cm * np.sqrt(abs(value)))
-        for value in eigenvals
-        if value < -tol_eig
-    ]
+    real = factor_cm * np.sqrt(eigenvals[eigenvals > tol_eig])
+    imaginary = -factor_cm * np.sqrt(np.abs(eigenvals[eigenvals < -tol_eig]))
 
-    return sorted(real, reverse=True), sorted(imaginary)
+    # real modes descending, imaginary modes ascending (most negative first)
+    return real[::-1].tolist(), imaginary.tolist()
 
 
 def frequencies_from_partial_hessian(dof_labels, hessian_matrix, atoms):
@@ -521,8 +729,10 @@ def frequencies_from_partial_hessian(dof_labels, hessian_matrix, atoms):
     ----------
     dof_labels : list[str]
         Degree-of-freedom labels (for example ``1X``).
-    hessian_matrix : list[list[float]]
-        Hessian values in eV/Å² units for selected DOFs.
+    hessian_matrix : array_like
+        Hessian values in eV/Å² units for selected DOFs, as nested lists
+        (e.g. loaded from YAML) or a square NumPy array. The input is
+        converted once and never modified.
     atoms : ase.Atoms
         Atomic structure used to assign atomic masses.
 
@@ -536,6 +746,7 @@ def frequencies_from_partial_hessian(dof_labels, hessian_matrix, atoms):
 
 
 _ASE_DISPLACEMENT_RE = re.compile(r"^cache\.(\d+)([xyz])([+-])\.json$")
+_VIB_DIR_RE = re.compile(r"^vib\d+$")
 
 
 def _decode_ase_ndarray(value):
@@ -554,7 +765,7 @@ def _find_vibration_directories(outcar_path):
 
     dirs = [
         p for p in parent.iterdir()
-        if p.is_dir() and re.match(r"^vib\d+$", p.name)
+        if p.is_dir() and _VIB_DIR_RE.match(p.name)
     ]
 
     return sorted(dirs, key=lambda p: int(p.name[3:]))
@@ -621,30 +832,18 @@ def extract_ase_vibration_hessian(outcar_path, delta=0.01):
 
 def formula_from_atom_order(atoms):
     """Build a chemical formula preserving first-seen element order."""
-    counts = {}
-    order = []
-
-    for atom in atoms:
-        sym = atom.symbol
-        if sym not in counts:
-            counts[sym] = 0
-            order.append(sym)
-        counts[sym] += 1
-
-    formula = ""
-    for sym in order:
-        n = counts[sym]
-        formula += f"{sym}{n if n > 1 else ''}"
+    # Counter keeps first-seen order; symbols avoid per-site Atom objects
+    counts = Counter(atoms.get_chemical_symbols())
 
-    return formula
+    return "".join(f"{sym}{n if n > 1 else ''}" for sym, n in counts.items())
 
 
 def lattice_vectors(atoms, precision=8):
     """Return lattice vectors rounded for stable YAML serialization."""
-    fmt = f"{{:.{precision}f}}"
+    # round() is correctly rounded, i.e. equal to float(f"{x:.{precision}f}")
     return [
-        InlineList([float(fmt.format(x)) for x in vec])
-        for vec in atoms.cell.array
+        InlineList([round(x, precision) for x in vec])
+        for vec in atoms.cell.array.tolist()
     ]
 
 def geometry_direct_strings(atoms, precision=8):
@@ -653,24 +852,205 @@ def geometry_direct_strings(atoms, precision=8):
 
     Using strings avoids YAML ambiguity and keeps diffs clean.
     """
-    scaled = atoms.get_scaled_positions()
+    scaled = atoms.get_scaled_positions().tolist()
+    symbols = atoms.get_chemical_symbols()
 
-    fmt = f"{{:.{precision}f}}"
-    lines = []
+    fmt = f"%s %.{precision}f %.{precision}f %.{precision}f"
 
-    for atom, pos in zip(atoms, scaled):
-        x, y, z = pos
-        lines.append(
-            f"{atom.symbol} {fmt.format(x)} {fmt.format(y)} {fmt.format(z)}"
-        )
+    return [fmt % (symbol, x, y, z) for symbol, (x, y, z) in zip(symbols, scaled)]
+
+
+# ============================================================
+# Fused OUTCAR scan
+# ============================================================
+
+# Buffer size used when streaming OUTCAR files line by line.
+_READ_BUFFER_SIZE = 1 << 20
 
-    return lines
+
+@dataclass(slots=True)
+class _OutcarScan:
+    """Line-oriented OUTCAR metadata collected by :func:`_scan_outcar`."""
+
+    incar: dict
+    hubbard_u: dict | None
+    potcar: list
+    vasp_version: str | None
+    executed_at: str | None
+    ionic_energies: list
+    total_energies: list
+
+
+def _scan_outcar(lines):
+    """Collect all line-oriented OUTCAR metadata in a single pass.
+
+    The result matches calling :func:`extract_incar_settings`,
+    :func:`extract_hubbard_u_settings`, :func:`extract_potcar_info`,
+    :func:`extract_vasp_version`, :func:`extract_execution_timestamp`,
+    :func:`extract_ionic_energies` and :func:`extract_total_energies` on the
+    same text, but walks the lines once. Frequencies are located separately
+    by :func:`extract_frequencies`, which jumps straight to the mode listing.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        OUTCAR lines, e.g. ``text.splitlines()`` or an open text stream.
+
+    Returns
+    -------
+    _OutcarScan
+        Collected settings and energies.
+    """
+    incar = {}
+    hubbard = dict.fromkeys(_HUBBARD_KEYS)
+    pots = {}
+    vasp_version = None
+    executed_at = None
+    ionic_energies = []
+    total_energies = []
+    in_header = True
+    in_parameters = True
+
+    for line in lines:
+        if vasp_version is None:
+            match = _VASP_VERSION_RE.search(line)
+            if match:
+                vasp_version = match.group(1)
+
+        if executed_at is None:
+            match = _EXECUTED_AT_RE.search(line)
+            if match:
+                executed_at = _format_execution_timestamp(match)
+
+        if in_header:
+            if _POTCAR_HEADER_END in line:
+                in_header = False
+                continue
+
+            entry = _potcar_entry(line)
+            if entry is not None:
+                pots[entry] = None
+                continue
+
+        if in_parameters and _PARAMETERS_END in line:
+            in_parameters = False
+            continue
+
+        # Every remaining tag (INCAR and LDA+U echoes, energy lines) is a
+        # ``key = value`` line, so most OUTCAR lines are rejected by one test.
+        if "=" not in line:
+            continue
+
+        if in_parameters:
+            if line.lstrip().startswith(_INCAR_KEY_PREFIXES):
+                match = _INCAR_RE.match(line)
+                if match:
+                    key = match.group(1)
+                    incar[key] = _clean_value(match.group(2), IMPORTANT_KEYS[key])
+                    continue
+
+            if "LDAU" in line:
+                _apply_hubbard_line(hubbard, line)
+
+        energy = _ionic_energy(line)
+        if energy is not None:
+            ionic_energies.append(energy)
+            continue
+
+        energy = _total_energy(line)
+        if energy is not None:
+            total_energies.append(energy)
+
+    return _OutcarScan(
+        incar=incar,
+        hubbard_u=_finalize_hubbard(hubbard),
+        potcar=list(pots),
+        vasp_version=vasp_version,
+        executed_at=executed_at,
+        ionic_energies=ionic_energies,
+        total_energies=total_energies,
+    )
+
+
+@lru_cache(maxsize=8)
+def _scan_outcar_cached(path_str, mtime_ns, size):
+    """Run :func:`_scan_outcar` while streaming ``path_str`` from disk.
+
+    Memoized on the path, modification time and size, so the OUTCAR is only
+    scanned again when it changes. The returned scan is shared between
+    callers and must not be mutated.
+    """
+    with open(path_str, "r", errors="ignore", buffering=_READ_BUFFER_SIZE) as stream:
+        return _scan_outcar(stream)
+
+
+def _scan_outcar_file(path):
+    """Return a private copy of the (cached) fused scan of ``path``."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return copy.deepcopy(_scan_outcar_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def invalidate_cache():
+    """Discard all memoized OUTCAR scans.
+
+    Scans are keyed on path, modification time and size, so edited files
+    are picked up automatically. Call this to release the memory held by
+    the cache, or when an OUTCAR is rewritten in place with an unchanged
+    size and timestamp.
+    """
+    _scan_outcar_cached.cache_clear()
+
+
+def _read_vibration_section(path):
+    """Return the OUTCAR text from the start of the vibrational analysis.
+
+    The file is memory-mapped to locate the first ``Eigenvectors and
+    eigenvalues`` header and the last ``SECOND DERIVATIVES`` block, and only
+    the text from the earliest of the two onwards is decoded. This is all
+    that :func:`extract_frequencies`, :func:`extract_perturbed_hessian` and
+    :func:`extract_hessian_from_dynamical_modes` look at. Without a mode
+    listing the whole file is returned.
+    """
+    path = Path(path)
+
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return ""
+
+        with mapped:
+            start = mapped.find(_FREQUENCY_ANCHOR.encode())
+            if start < 0:
+                start = 0
+            else:
+                hessian = mapped.rfind(b"SECOND DERIVATIVES (NOT SYMMETRIZED)", 0, start)
+                if hessian >= 0:
+                    start = hessian
+                start = mapped.rfind(b"\n", 0, start) + 1
+
+    # ``start`` is a byte offset, which only a binary stream can seek to;
+    # decode from there as ``open(path, "r")`` would (locale encoding,
+    # universal newlines).
+    with path.open("rb") as raw:
+        raw.seek(start)
+        with io.TextIOWrapper(raw, errors="ignore") as stream:
+            return stream.read()
 
 
 # ============================================================
 # Main parser
 # ============================================================
 
+def _generator_metadata():
+    """Return the ``pymkmkit`` header block stamped on parsed YAML output."""
+    return {
+        "version": get_version(),
+        "generated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+
+
 def parse_vasp_frequency(outcar_path, average_pairs=False):
     """Parse a VASP frequency OUTCAR file into pymkmkit YAML schema.
 
@@ -684,32 +1064,26 @@ def parse_vasp_frequency(outcar_path, average_pairs=False):
     Returns
     -------
     dict
-        Structured dictionary ready to be serialized to YAML.
+        Structured dictionary ready to be serialized to YAML. The
+        ``vibrations.frequencies_cm-1`` list is sorted in descending order.
     """
     path = Path(outcar_path)
 
     if not path.exists():
         raise FileNotFoundError(outcar_path)
 
-    text = path.read_text(errors="ignore")
+    atoms = _read_final_atoms(path)
 
-    # ASE reads final structure & energy
-    atoms = read(outcar_path)
-
-    incar = extract_incar_settings(text)
-    hubbard_u = extract_hubbard_u_settings(text)
-    potcar = extract_potcar_info(text)
-    vasp_version = extract_vasp_version(text)
-    executed_at = extract_execution_timestamp(text)
+    scan = _scan_outcar_file(path)
+    text = _read_vibration_section(path)
     real_freqs, imag_freqs = extract_frequencies(text)
     hessian_dofs, hessian_matrix = extract_perturbed_hessian(text)
     if not (hessian_dofs and hessian_matrix):
         hessian_dofs, hessian_matrix = extract_hessian_from_dynamical_modes(text, atoms)
-    ionic_energies = extract_ionic_energies(text)
-    if ionic_energies:
-        electronic_energy = ionic_energies[0]
+    if scan.ionic_energies:
+        electronic_energy = scan.ionic_energies[0]
     else:
-        electronic_energy = float(atoms.get_potential_energy())
+        raise ValueError(f"No electronic energy found in OUTCAR: {outcar_path}")
 
     # ---- vibrational processing ----
 
@@ -718,6 +1092,10 @@ def parse_vasp_frequency(outcar_path, average_pairs=False):
     if average_pairs:
         real_freqs, imag_freqs, pairing_note = average_mode_pairs(real_freqs, imag_freqs)
 
+    # VASP already lists modes from high to low; this pins the invariant
+    # (a no-op pass over sorted data) so consumers need not re-sort.
+    real_freqs.sort(reverse=True)
+
     vibration_block = {
         "frequencies_cm-1": real_freqs,
         "imaginary_cm-1": imag_freqs if imag_freqs else None,
@@ -738,10 +1116,7 @@ def parse_vasp_frequency(outcar_path, average_pairs=False):
     # ---- assemble output ----
 
     return {
-        "pymkmkit": {
-            "version": get_version(),
-            "generated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        },
+        "pymkmkit": _generator_metadata(),
         "structure": {
             "formula": formula_from_atom_order(atoms),
             "n_atoms": len(atoms),
@@ -751,12 +1126,12 @@ def parse_vasp_frequency(outcar_path, average_pairs=False):
         },
         "calculation": {
             "code": "VASP",
-            "version": vasp_version,
-            "executed_at": executed_at,
+            "version": scan.vasp_version,
+            "executed_at": scan.executed_at,
             "type": "frequency",
-            "incar": incar,
-            "hubbard_u": hubbard_u,
-            "potcar": potcar,
+            "incar": scan.incar,
+            "hubbard_u": scan.hubbard_u,
+            "potcar": scan.potcar,
         },
         "energy": {
             "electronic": electronic_energy,
@@ -772,32 +1147,20 @@ def parse_vasp_optimization(outcar_path):
     if not path.exists():
         raise FileNotFoundError(outcar_path)
 
-    text = path.read_text(errors="ignore")
-
     # geometry optimizations should store the last ionic step
-    atoms = _read_last_optimization_atoms(outcar_path, text)
-
-    incar = extract_incar_settings(text)
-    hubbard_u = extract_hubbard_u_settings(text)
-    potcar = extract_potcar_info(text)
-    vasp_version = extract_vasp_version(text)
-    executed_at = extract_execution_timestamp(text)
+    atoms = _read_last_optimization_atoms(outcar_path)
 
-    ionic_energies = extract_ionic_energies(text)
-    total_energies = extract_total_energies(text)
+    scan = _scan_outcar_file(path)
 
-    if ionic_energies:
-        electronic_energy = ionic_energies[-1]
-    elif total_energies:
-        electronic_energy = total_energies[-1]
+    if scan.ionic_energies:
+        electronic_energy = scan.ionic_energies[-1]
+    elif scan.total_energies:
+        electronic_energy = scan.total_energies[-1]
     else:
-        electronic_energy = float(atoms.get_potential_energy())
+        raise ValueError(f"No electronic energy found in OUTCAR: {outcar_path}")
 
     return {
-        "pymkmkit": {
-            "version": get_version(),
-            "generated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        },
+        "pymkmkit": _generator_metadata(),
         "structure": {
             "formula": formula_from_atom_order(atoms),
             "n_atoms": len(atoms),
@@ -807,12 +1170,12 @@ def parse_vasp_optimization(outcar_path):
         },
         "calculation": {
             "code": "VASP",
-            "version": vasp_version,
-            "executed_at": executed_at,
+            "version": scan.vasp_version,
+            "executed_at": scan.executed_at,
             "type": "optimization",
-            "incar": incar,
-            "hubbard_u": hubbard_u,
-            "potcar": potcar,
+            "incar": scan.incar,
+            "hubbard_u": scan.hubbard_u,
+            "potcar": scan.potcar,
         },
         "energy": {
             "electronic": electronic_energy,
@@ -827,16 +1190,13 @@ def parse_ase_vibrations(outcar_path):
     if not path.exists():
         raise FileNotFoundError(outcar_path)
 
-    text = path.read_text(errors="ignore")
-    atoms = _read_last_optimization_atoms(outcar_path, text)
+    atoms = _read_last_optimization_atoms(outcar_path)
 
-    incar = extract_incar_settings(text)
-    hubbard_u = extract_hubbard_u_settings(text)
-    potcar = extract_potcar_info(text)
-    vasp_version = extract_vasp_version(text)
-    executed_at = extract_execution_timestamp(text)
-    ionic_energies = extract_ionic_energies(text)
-    electronic_energy = ionic_energies[-1] if ionic_energies else float(atoms.get_potential_energy())
+    scan = _scan_outcar_file(path)
+    if scan.ionic_energies:
+        electronic_energy = scan.ionic_energies[-1]
+    else:
+        raise ValueError(f"No electronic energy found in OUTCAR: {outcar_path}")
 
     hessian_dofs, hessian_matrix = extract_ase_vibration_hessian(outcar_path)
     frequencies, imaginary = _split_frequencies_from_partial_hessian(
@@ -846,10 +1206,7 @@ def parse_ase_vibrations(outcar_path):
     )
 
     return {
-        "pymkmkit": {
-            "version": get_version(),
-            "generated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        },
+        "pymkmkit": _generator_metadata(),
         "structure": {
             "formula": formula_from_atom_order(atoms),
             "n_atoms": len(atoms),
@@ -859,12 +1216,12 @@ def parse_ase_vibrations(outcar_path):
         },
         "calculation": {
             "code": "VASP",
-            "version": vasp_version,
-            "executed_at": executed_at,
+            "version": scan.vasp_version,
+            "executed_at": scan.executed_at,
             "type": "frequency",
-            "incar": incar,
-            "hubbard_u": hubbard_u,
-            "potcar": potcar,
+            "incar": scan.incar,
+            "hubbard_u": scan.hubbard_u,
+            "potcar": scan.potcar,
         },
         "energy": {
             "electronic": electronic_energy,
@@ -879,6 +1236,12 @@ def parse_ase_vibrations(outcar_path):
         },
     }
 
+def _pair_average(values):
+    """Average an even-length sequence in sequential pairs."""
+    pairs = np.asarray(values, dtype=np.float64).reshape(-1, 2)
+    return (pairs.sum(axis=1) / 2.0).tolist()
+
+
 def average_mode_pairs(real_freqs, imag_freqs):
     """
     Average real frequencies in sequential pairs (1+2, 3+4, ...).
@@ -886,6 +1249,9 @@ def average_mode_pairs(real_freqs, imag_freqs):
     TS edge case:
     If number of real modes is odd and exactly one imaginary mode exists,
     drop the last unpaired real mode and proceed.
+
+    Both inputs may be lists or NumPy arrays; the averaged modes are always
+    returned as lists of Python floats, ready for YAML serialization.
     """
 
     note = None
@@ -906,10 +1272,7 @@ def average_mode_pairs(real_freqs, imag_freqs):
                 "imaginary mode count != 1."
             )
 
-    averaged_real = [
-        (real_freqs[i] + real_freqs[i + 1]) / 2.0
-        for i in range(0, len(real_freqs), 2)
-    ]
+    averaged_real = _pair_average(real_freqs)
 
     if len(imag_freqs) % 2 == 1 and len(imag_freqs) != 1:
         raise ValueError(
@@ -918,11 +1281,8 @@ def average_mode_pairs(real_freqs, imag_freqs):
         )
 
     if len(imag_freqs) == 1:
-        averaged_imag = imag_freqs
+        averaged_imag = [float(imag_freqs[0])]
     else:
-        averaged_imag = [
-            (imag_freqs[i] + imag_freqs[i + 1]) / 2.0
-            for i in range(0, len(imag_freqs), 2)
-        ]
+        averaged_imag = _pair_average(imag_freqs)
 
     return averaged_real, averaged_imag, note
@@ -1,5 +1,14 @@
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it; the rest of
+# the package imports these from here.
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 class InlineList(list):
     """Force YAML to print list in flow style."""
@@ -28,12 +37,33 @@ def represent_inline_list(dumper, data):
     )
 
 
-yaml.SafeDumper.add_representer(InlineList, represent_inline_list)
+_SafeDumper.add_representer(InlineList, represent_inline_list)
+
+
+class _NoAliasDumper(_SafeDumper):
+    """Safe dumper that writes repeated objects in full.
+
+    :func:`clean_none` hands back the caller's own lists, so a row or label
+    list referenced twice must not turn into a ``&id001`` / ``*id001`` pair.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def _has_containers(values):
+    """Return whether any element of ``values`` is a dict or a list."""
+    # Collect the distinct element types at C speed, then test only those.
+    return any(issubclass(t, (dict, list)) for t in set(map(type, values)))
 
 
 def clean_none(d):
     """Recursively remove keys/items whose value is ``None``.
 
+    Containers without any ``None`` dict value below them are returned
+    as-is instead of being copied, so large numeric blocks such as Hessian
+    matrices are not rebuilt.
+
     Parameters
     ----------
     d : Any
@@ -47,15 +77,25 @@ def clean_none(d):
     """
     # Preserve dicts
     if isinstance(d, dict):
-        return {k: clean_none(v) for k, v in d.items() if v is not None}
+        cleaned = {k: clean_none(v) for k, v in d.items() if v is not None}
+        if type(d) is dict and len(cleaned) == len(d) and all(
+            cleaned[k] is v for k, v in d.items()
+        ):
+            return d
+        return cleaned
 
-    # Preserve InlineList type (CRUCIAL)
-    if isinstance(d, InlineList):
-        return InlineList(clean_none(v) for v in d)
-
-    # Normal lists
     if isinstance(d, list):
-        return [clean_none(v) for v in d]
+        # Preserve InlineList type (CRUCIAL)
+        kind = InlineList if isinstance(d, InlineList) else list
+
+        # Rows of scalars (coordinates, Hessian rows) cannot contain a dict.
+        if not _has_containers(d):
+            return d if type(d) is kind else kind(d)
+
+        items = [clean_none(v) for v in d]
+        if type(d) is kind and all(a is b for a, b in zip(items, d)):
+            return d
+        return kind(items)
 
     return d
 
@@ -70,10 +110,10 @@ def write_yaml(data, filename):
     filename : str | pathlib.Path
         Target YAML file path.
     """
-    with open(filename, "w") as f:
+    with open(filename, "w", encoding="utf-8") as f:
         yaml.dump(
             clean_none(data),
             f,
             sort_keys=False,
-            Dumper=yaml.SafeDumper,
+            Dumper=_NoAliasDumper,
         )
@@ -0,0 +1,49 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def pytest_configure(config):
+    # Registered here as well so the marker is known without pytest-xdist.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests sharing an OUTCAR archive on one worker",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def matplotlib_agg_backend():
+    """Render every figure off-screen with the Agg backend.
+
+    Selecting the backend once, before ``pyplot`` is first imported, keeps
+    the ``build_ped`` tests from initialising a GUI toolkit (or blocking in
+    ``plt.show``) when ``MPLBACKEND`` or a desktop session is present.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+@pytest.fixture(scope="session")
+def extract_outcar(tmp_path_factory):
+    """Return a function that unpacks a data archive once per test session.
+
+    The extracted files are shared between tests and must be treated as
+    read-only; tests write their outputs to their own ``tmp_path``.
+    """
+    extracted = {}
+
+    def extract(zip_name):
+        if zip_name not in extracted:
+            target = tmp_path_factory.mktemp(zip_name.replace(".zip", ""))
+            with zipfile.ZipFile(DATA_DIR / zip_name, "r") as z:
+                z.extractall(target)
+            default = target / zip_name.replace(".zip", "")
+            extracted[zip_name] = default if default.exists() else target
+        return extracted[zip_name]
+
+    return extract
@@ -1,29 +1,16 @@
-import zipfile
-from pathlib import Path
-
 import yaml
 import pytest
 from click.testing import CliRunner
 
+from pymkmkit import network_reader
 from pymkmkit.cli import cli
 from pymkmkit.network_reader import _format_chemical_subscripts, read_network
+from pymkmkit.yaml_writer import _YamlLoader
 
 
-DATA_DIR = Path(__file__).parent / "data"
-
-
-def _extract_outcar(zip_name, tmp_path):
-    zip_path = DATA_DIR / zip_name
-    with zipfile.ZipFile(zip_path, "r") as z:
-        z.extractall(tmp_path)
-    default = tmp_path / zip_name.replace(".zip", "")
-    if default.exists():
-        return default
-    return tmp_path
-
-
-def test_freq2yaml_cli_writes_frequency_yaml(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ru1121_C.zip", tmp_path)
+@pytest.mark.xdist_group("OUTCAR_Ru1121_C")
+def test_freq2yaml_cli_writes_frequency_yaml(tmp_path, extract_outcar):
+    outcar = extract_outcar("OUTCAR_Ru1121_C.zip")
     output = tmp_path / "freq.yaml"
 
     runner = CliRunner()
@@ -35,15 +22,16 @@ def test_freq2yaml_cli_writes_frequency_yaml(tmp_path):
     assert result.exit_code == 0
     assert output.exists()
 
-    parsed = yaml.safe_load(output.read_text())
+    parsed = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert parsed["calculation"]["type"] == "frequency"
     assert parsed["calculation"]["version"] == "6.5.1"
     assert parsed["calculation"]["executed_at"] == "2025-11-02T10:24:49Z"
     assert parsed["vibrations"]["paired_modes_averaged"] is True
 
 
-def test_opt2yaml_cli_writes_optimization_yaml(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ni311_C.zip", tmp_path)
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_opt2yaml_cli_writes_optimization_yaml(tmp_path, extract_outcar):
+    outcar = extract_outcar("OUTCAR_Ni311_C.zip")
     output = tmp_path / "opt.yaml"
 
     runner = CliRunner()
@@ -55,15 +43,16 @@ def test_opt2yaml_cli_writes_optimization_yaml(tmp_path):
     assert result.exit_code == 0
     assert output.exists()
 
-    parsed = yaml.safe_load(output.read_text())
+    parsed = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert parsed["calculation"]["type"] == "optimization"
     assert parsed["calculation"]["version"] == "5.3.5"
     assert parsed["calculation"]["executed_at"] == "2019-05-22T13:55:02Z"
     assert "vibrations" not in parsed
 
 
-def test_asevib2yaml_cli_writes_frequency_yaml_from_vib_folders(tmp_path):
-    root = _extract_outcar("CeO2_Pd4_CO.zip", tmp_path)
+@pytest.mark.xdist_group("CeO2_Pd4_CO")
+def test_asevib2yaml_cli_writes_frequency_yaml_from_vib_folders(tmp_path, extract_outcar):
+    root = extract_outcar("CeO2_Pd4_CO.zip")
     outcar = root / "OUTCAR"
     output = tmp_path / "asevib.yaml"
 
@@ -76,7 +65,7 @@ def test_asevib2yaml_cli_writes_frequency_yaml_from_vib_folders(tmp_path):
     assert result.exit_code == 0
     assert output.exists()
 
-    parsed = yaml.safe_load(output.read_text())
+    parsed = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert parsed["calculation"]["type"] == "frequency"
     assert len(parsed["vibrations"]["partial_hessian"]["dof_labels"]) == 12
 
@@ -892,7 +881,7 @@ network:
     result = runner.invoke(cli, ["network2fnf", str(network_file), "-o", str(output)])
 
     assert result.exit_code == 0
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
 
     assert payload["pymkmkit"]["units"] == "eV"
     assert payload["pymkmkit"]["energy_type"] == "elec+zpe"
@@ -984,7 +973,7 @@ network:
     )
 
     assert result.exit_code == 0
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
 
     assert payload["nodes"] == [
         {"label": "A*", "structure": "structures/a.yaml"},
@@ -1083,7 +1072,7 @@ network:
     )
 
     assert result.exit_code == 0
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
 
     assert payload["nodes"] == [
         {"label": "A1*", "structure": "structures/a__1.yaml"},
@@ -1167,7 +1156,7 @@ network:
     assert "step ab (A* <-> B*)" in result.output
     assert "step bc (B* <-> C*)" in result.output
 
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert payload["edges"] == []
 
 
@@ -1227,7 +1216,7 @@ network:
     )
 
     assert result.exit_code == 0
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert payload["pymkmkit"]["units"] == "kJ/mol"
     assert payload["edges"][0]["ads"] == 96.48533212
 
@@ -1303,7 +1292,7 @@ network:
     assert result.exit_code == 0
     assert "WARNING" in result.output
     assert "bimolecular surf" in result.output
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert payload["edges"][0]["nodes"] == ["A*", "B*"]
     output_lines = output.read_text().splitlines()
     warning_lines = [line.strip() for line in output_lines if "# WARNING:" in line]
@@ -1375,7 +1364,7 @@ network:
 
     assert result.exit_code == 0
     assert "WARNING" not in result.output
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     split_edges = [edge for edge in payload["edges"] if edge["name"] == "bimolecular surf"]
     assert len(split_edges) == 2
     assert split_edges[0]["nodes"] == ["A*", "B*"]
@@ -1447,7 +1436,7 @@ network:
     assert result.exit_code == 0
     assert "WARNING" in result.output
     assert "unsupported multinode surf" in result.output
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert payload["edges"][0]["nodes"] == ["A*", "C*", "B*", "D*"]
     assert "# WARNING:" in output.read_text()
 
@@ -1504,6 +1493,76 @@ network:
         read_network(network_file)
 
 
+def test_read_network_rejects_unknown_state_with_step_name(tmp_path):
+    states_dir = tmp_path / "states"
+    states_dir.mkdir()
+
+    (states_dir / "is.yaml").write_text(
+        "energy:\n  electronic: -1.0\n",
+        encoding="utf-8",
+    )
+
+    network_file = tmp_path / "network.yaml"
+    network_file.write_text(
+        """
+stable_states:
+  - name: IS*
+    file: states/is.yaml
+network:
+  - name: dangling step
+    type: rearrangement
+    reaction: IS* => FS*
+    is:
+      - name: IS*
+    fs:
+      - name: FS*
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="Unknown state 'FS\\*' referenced in network step 'dangling step'"):
+        read_network(network_file)
+
+
+def test_read_network_rejects_null_frequency(tmp_path):
+    states_dir = tmp_path / "states"
+    states_dir.mkdir()
+
+    (states_dir / "is.yaml").write_text(
+        "energy:\n  electronic: -1.0\nvibrations:\n  frequencies_cm-1: [100.0, null]\n",
+        encoding="utf-8",
+    )
+    (states_dir / "fs.yaml").write_text(
+        "energy:\n  electronic: -2.0\n",
+        encoding="utf-8",
+    )
+
+    network_file = tmp_path / "network.yaml"
+    network_file.write_text(
+        """
+stable_states:
+  - name: IS*
+    file: states/is.yaml
+  - name: FS*
+    file: states/fs.yaml
+network:
+  - name: IS to FS
+    type: rearrangement
+    reaction: IS* => FS*
+    is:
+      - name: IS*
+    fs:
+      - name: FS*
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="has non-numeric frequency values"):
+        read_network(network_file)
+
+
 def test_read_network_supports_rearrangement_steps(tmp_path):
     states_dir = tmp_path / "states"
     states_dir.mkdir()
@@ -1568,8 +1627,196 @@ network:
         -(0.5 + 0.5 * 300.0 * 1.239841984e-4)
     )
     assert step.reaction_heat_total == pytest.approx(step.forward_total_barrier)
+    assert step.forward_equation.startswith("E_el: ")
+    assert step.reverse_equation == f"-({step.forward_equation})"
+
+    lean_step = read_network(network_file, equations=False)[0]
+    assert lean_step.forward_equation is None
+    assert lean_step.reverse_equation is None
+    assert lean_step.forward_total_barrier == step.forward_total_barrier
+
+
+def test_read_network_resolves_state_files_without_extension(tmp_path):
+    states_dir = tmp_path / "states"
+    states_dir.mkdir()
+
+    (states_dir / "is.yaml").write_text(
+        "energy:\n  electronic: -10.0\n",
+        encoding="utf-8",
+    )
+    (states_dir / "fs.yml").write_text(
+        "energy:\n  electronic: -9.5\n",
+        encoding="utf-8",
+    )
+
+    network_file = tmp_path / "network.yaml"
+    network_file.write_text(
+        """
+stable_states:
+  - name: A*
+    file: states/is
+  - name: B*
+    file: ./states/../states/fs
+network:
+  - name: A to B
+    type: rearrangement
+    reaction: A* => B*
+    is:
+      - name: A*
+    fs:
+      - name: B*
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
 
+    steps = read_network(network_file)
+
+    assert steps[0].forward_barrier_electronic == pytest.approx(0.5)
+
+
+def test_read_network_resolves_symlinks_before_parent_components(tmp_path):
+    real_dir = tmp_path / "real"
+    (real_dir / "sub").mkdir(parents=True)
+    (tmp_path / "link").symlink_to(real_dir / "sub", target_is_directory=True)
+
+    (real_dir / "is.yaml").write_text(
+        "energy:\n  electronic: -10.0\n",
+        encoding="utf-8",
+    )
+    (real_dir / "fs.yaml").write_text(
+        "energy:\n  electronic: -9.5\n",
+        encoding="utf-8",
+    )
+
+    # ``link/..`` is ``real``, not ``tmp_path``: a lexical normalization
+    # would look for the files next to the network file.
+    network_file = tmp_path / "network.yaml"
+    network_file.write_text(
+        """
+stable_states:
+  - name: A*
+    file: link/../is
+  - name: B*
+    file: link/../fs.yaml
+network:
+  - name: A to B
+    type: rearrangement
+    reaction: A* => B*
+    is:
+      - name: A*
+    fs:
+      - name: B*
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    steps = read_network(network_file)
 
+    assert steps[0].forward_barrier_electronic == pytest.approx(0.5)
+
+
+def test_read_network_rereads_state_files_after_modification(tmp_path):
+    states_dir = tmp_path / "states"
+    states_dir.mkdir()
+
+    (states_dir / "is.yaml").write_text(
+        "energy:\n  electronic: -10.0\n",
+        encoding="utf-8",
+    )
+    fs_file = states_dir / "fs.yaml"
+    fs_file.write_text(
+        "energy:\n  electronic: -9.5\n",
+        encoding="utf-8",
+    )
+
+    network_file = tmp_path / "network.yaml"
+    network_file.write_text(
+        """
+stable_states:
+  - name: A*
+    file: states/is.yaml
+  - name: B*
+    file: states/fs.yaml
+network:
+  - name: A to B
+    type: rearrangement
+    reaction: A* => B*
+    is:
+      - name: A*
+    fs:
+      - name: B*
+""".strip()
+        + "\n",
+        encoding="utf-8",
+    )
+
+    assert read_network(network_file)[0].forward_barrier_electronic == pytest.approx(0.5)
+
+    fs_file.write_text(
+        "energy:\n  electronic: -9.25\n",
+        encoding="utf-8",
+    )
+
+    assert read_network(network_file)[0].forward_barrier_electronic == pytest.approx(0.75)
+
+
+def test_read_network_parses_only_uncached_state_files_on_a_thread_pool(
+    tmp_path, monkeypatch
+):
+    states_dir = tmp_path / "states"
+    states_dir.mkdir()
+
+    n_states = 20
+    entries = []
+    for i in range(n_states):
+        (states_dir / f"s{i}.yaml").write_text(
+            f"energy:\n  electronic: {-10.0 + 0.25 * i}\n",
+            encoding="utf-8",
+        )
+        entries.append(f"  - name: S{i}*\n    file: states/s{i}.yaml")
+
+    network_file = tmp_path / "network.yaml"
+    network_file.write_text(
+        "stable_states:\n"
+        + "\n".join(entries)
+        + """
+network:
+  - name: S0 to S1
+    type: rearrangement
+    reaction: S0* => S1*
+    is:
+      - name: S0*
+    fs:
+      - name: S1*
+""",
+        encoding="utf-8",
+    )
+
+    pools = []
+    executor = network_reader.ThreadPoolExecutor
+
+    def recording_executor(*args, **kwargs):
+        pools.append(kwargs.get("max_workers"))
+        return executor(*args, **kwargs)
+
+    monkeypatch.setattr(network_reader, "ThreadPoolExecutor", recording_executor)
+
+    assert read_network(network_file)[0].forward_barrier_electronic == pytest.approx(0.25)
+    assert pools == [n_states]
+
+    # Every state file is now cached: no pool for a repeated read.
+    assert read_network(network_file)[0].forward_barrier_electronic == pytest.approx(0.25)
+    assert pools == [n_states]
+
+    # A single edited file is below the threshold and read serially.
+    (states_dir / "s1.yaml").write_text(
+        "energy:\n  electronic: -9.0\n",
+        encoding="utf-8",
+    )
+    assert read_network(network_file)[0].forward_barrier_electronic == pytest.approx(1.0)
+    assert pools == [n_states]
 
 
 def test_read_network_cli_displays_rearrangement_type(tmp_path):
@@ -1683,7 +1930,7 @@ network:
     result = runner.invoke(cli, ["network2fnf", str(network_file), "-o", str(output)])
 
     assert result.exit_code == 0
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     edge = payload["edges"][0]
     assert edge["type"] == "rearrangement"
     assert edge["nodes"] == ["A*", "B*"]
@@ -1833,7 +2080,7 @@ edges:
     assert "Skipped elementary reaction steps:" in result.output
     assert "  - skip me (A* <-> B*)" in result.output
 
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
     assert payload["nodes"] == [{"label": "A*"}, {"label": "B*"}, {"label": "C*"}]
     assert [edge["name"] for edge in payload["edges"]] == ["existing AB", "add me"]
 
@@ -1913,7 +2160,7 @@ network:
     )
 
     assert result.exit_code == 0
-    payload = yaml.safe_load(output.read_text())
+    payload = yaml.load(output.read_text(), Loader=_YamlLoader)
 
     assert payload["edges"][0]["structure"] == "structures/oh_hydr.yaml"
 
@@ -1978,7 +2225,7 @@ vibrations:
     assert result.exit_code == 0
     assert "wrong sign detected" in result.output
 
-    parsed = yaml.safe_load(output_yaml.read_text())
+    parsed = yaml.load(output_yaml.read_text(), Loader=_YamlLoader)
     row0 = parsed["vibrations"]["partial_hessian"]["matrix"][0]
     assert row0[0] == pytest.approx(11.028369)
     assert row0[1] == pytest.approx(0.476227)
@@ -2011,7 +2258,7 @@ vibrations:
     assert result.exit_code == 0
     assert "No sign flip needed" in result.output
 
-    parsed = yaml.safe_load(output_yaml.read_text())
+    parsed = yaml.load(output_yaml.read_text(), Loader=_YamlLoader)
     row0 = parsed["vibrations"]["partial_hessian"]["matrix"][0]
     assert row0[0] == pytest.approx(11.028369)
     assert row0[1] == pytest.approx(0.476227)
@@ -1,43 +1,61 @@
-import zipfile
 from pathlib import Path
+import re
+import shutil
 
+import numpy as np
 import yaml
 import pytest
+from ase import Atoms
 from ase.io import read
 
 from pymkmkit.vasp_freq import (
+    _parse_atomic_symbols,
     average_mode_pairs,
     extract_ase_vibration_hessian,
+    formula_from_atom_order,
+    geometry_direct_strings,
+    lattice_vectors,
     frequencies_from_partial_hessian,
     parse_ase_vibrations,
     parse_vasp_frequency,
     parse_vasp_optimization,
     extract_hubbard_u_settings,
+    extract_incar_settings,
+    invalidate_cache,
 )
-from pymkmkit.yaml_writer import write_yaml
+from pymkmkit.yaml_writer import InlineList, _YamlLoader, clean_none, write_yaml
 
 
-DATA_DIR = Path(__file__).parent / "data"
+_SIGMA0_RE = re.compile(
+    rb"energy  without entropy=[^\n]*energy\(sigma->0\)[^\n]*=([^\n=]*)$",
+    re.MULTILINE,
+)
 
 
-def _extract_outcar(zip_name, tmp_path):
-    zip_path = DATA_DIR / zip_name
-    with zipfile.ZipFile(zip_path, "r") as z:
-        z.extractall(tmp_path)
-    default = tmp_path / zip_name.replace(".zip", "")
-    if default.exists():
-        return default
-    return tmp_path
+def _outcar_sigma0_energies(outcar_path):
+    data = Path(outcar_path).read_bytes()
+    return [float(value) for value in _SIGMA0_RE.findall(data)]
 
 
-def _outcar_sigma0_energies(outcar_path):
-    energies = []
+def _with_potcar_names(outcar_path, target, names):
+    """Copy an OUTCAR, renaming its ``PAW_PBE <name>`` POTCAR entries."""
+    text = Path(outcar_path).read_text()
+    for old, new in names.items():
+        text = text.replace(f"PAW_PBE {old} ", f"PAW_PBE {new} ")
+    target.write_text(text)
+    return target
+
+
+@pytest.fixture(scope="module")
+def ni311_frequency(extract_outcar):
+    """Frequency parse of the Ni(311) OUTCAR, shared by read-only tests."""
+    return parse_vasp_frequency(extract_outcar("OUTCAR_Ni311_C.zip"))
 
-    for line in Path(outcar_path).read_text(errors="ignore").splitlines():
-        if "energy  without entropy=" in line and "energy(sigma->0)" in line:
-            energies.append(float(line.split("=")[-1].strip()))
 
-    return energies
+@pytest.fixture(scope="module")
+def ni311_last_atoms(extract_outcar):
+    """Final ionic step of the Ni(311) OUTCAR as read by ASE."""
+    return read(extract_outcar("OUTCAR_Ni311_C.zip"), index=-1)
 
 
 
@@ -60,10 +78,66 @@ LDAU = .TRUE.
         "LDAUJ": [0.0, 0.0, 0.0, 0.0],
     }
 
-def test_parse_outcar_zip(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ni311_C.zip", tmp_path)
+def test_extract_incar_settings_matches_exact_keys():
+    text = """
+   ENCUT  =  400.0 eV  29.40 Ry    5.42 a.u.
+   EDIFF  = 0.1E-04   stopping-criterion for ELM
+   LREAL  =      F    real-space projection
+   LREAL_COMPAT= T    compatible to vasp.4.5.1-3
+   GGA_COMPAT  = T    GGA compatible to vasp.4.4-vasp.4.6
+   EDIFFG = 0.1E-03   stopping-criterion for IOM
+   IBRION =      5    ionic relax: 0-MD 1-quasi-New 2-CG
+"""
 
-    data = parse_vasp_frequency(outcar)
+    incar = extract_incar_settings(text)
+
+    assert incar == {
+        "ENCUT": 400.0,
+        "EDIFF": 1e-05,
+        "LREAL": "F",
+        "EDIFFG": 1e-04,
+        "IBRION": 5,
+    }
+
+def test_parse_atomic_symbols_strips_potcar_suffixes():
+    text = """
+   TITEL  = PAW_PBE Ni_pv 06Sep2000
+   TITEL  = PAW_PBE O_s 07Sep2000
+   TITEL  = PAW_PBE Ce_sv_GW 23Dec2003
+   TITEL  = PAW_PBE H1.25 07Sep2000
+   ions per type =               2   1   1   1
+"""
+
+    assert _parse_atomic_symbols(text) == ["Ni", "Ni", "O", "Ce", "H"]
+
+    with pytest.raises(ValueError, match="Unknown element"):
+        _parse_atomic_symbols("   TITEL  = PAW_PBE Qq_pv 06Sep2000\n   ions per type = 1\n")
+
+def test_structure_helpers_format_with_requested_precision():
+    atoms = Atoms(
+        symbols=["Ru", "Ru", "C", "O"],
+        cell=[[2.7, 0.0, 0.0], [-1.35, 2.338268, 0.0], [0.0, 0.0, 20.123456789]],
+        scaled_positions=[
+            [0.0, 0.0, 0.1],
+            [1.0 / 3.0, 2.0 / 3.0, 0.2],
+            [0.5, 0.25, 0.3],
+            [0.5, 0.25, 0.35],
+        ],
+        pbc=True,
+    )
+
+    assert formula_from_atom_order(atoms) == "Ru2CO"
+    assert geometry_direct_strings(atoms)[1] == "Ru 0.33333333 0.66666667 0.20000000"
+    assert geometry_direct_strings(atoms, precision=3)[3] == "O 0.500 0.250 0.350"
+    assert lattice_vectors(atoms)[2] == [0.0, 0.0, 20.12345679]
+    assert lattice_vectors(atoms, precision=2)[1] == [-1.35, 2.34, 0.0]
+
+
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_parse_outcar_zip(extract_outcar, ni311_frequency):
+    outcar = extract_outcar("OUTCAR_Ni311_C.zip")
+
+    data = ni311_frequency
 
     # basic structural checks
     assert data["structure"]["formula"].startswith("Ni")
@@ -81,31 +155,41 @@ def test_parse_outcar_zip(tmp_path):
     assert data["energy"]["electronic"] == sigma0_energies[0]
     assert data["energy"]["electronic"] != sigma0_energies[-1]
 
-    # vibrations parsed
-    assert len(data["vibrations"]["frequencies_cm-1"]) > 0
+    # vibrations parsed, highest mode first
+    freqs = data["vibrations"]["frequencies_cm-1"]
+    assert len(freqs) > 0
+    assert freqs == sorted(freqs, reverse=True)
     assert "partial_hessian" in data["vibrations"]
     assert data["calculation"]["version"] == "5.3.5"
     assert data["calculation"]["executed_at"] == "2019-05-22T13:55:02Z"
 
 
-def test_parse_ru1121_c_with_pair_averaging(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ru1121_C.zip", tmp_path)
+@pytest.mark.parametrize(
+    "zip_name, expect_imaginary",
+    [
+        pytest.param(
+            "OUTCAR_Ru1121_C.zip",
+            False,
+            marks=pytest.mark.xdist_group("OUTCAR_Ru1121_C"),
+        ),
+        ("OUTCAR_Ru1121_C_CH_TS.zip", True),
+    ],
+)
+def test_parse_ru1121_with_pair_averaging(extract_outcar, zip_name, expect_imaginary):
+    outcar = extract_outcar(zip_name)
 
     data = parse_vasp_frequency(outcar, average_pairs=True)
 
+    vibrations = data["vibrations"]
     assert data["structure"]["formula"].startswith("Ru")
-    assert data["vibrations"]["paired_modes_averaged"] is True
-    assert data["vibrations"]["imaginary_cm-1"] is None
-    assert data["vibrations"].get("pairing_note") is None
-
-
-def test_parse_ru1121_c_ch_ts_with_pair_averaging_and_ts_note(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ru1121_C_CH_TS.zip", tmp_path)
+    assert vibrations["paired_modes_averaged"] is True
 
-    data = parse_vasp_frequency(outcar, average_pairs=True)
+    if not expect_imaginary:
+        assert vibrations["imaginary_cm-1"] is None
+        assert vibrations.get("pairing_note") is None
+        return
 
-    vibrations = data["vibrations"]
-    assert vibrations["paired_modes_averaged"] is True
+    # TS: one imaginary mode, so the odd real mode is dropped before pairing
     assert vibrations["imaginary_cm-1"] is not None
     assert len(vibrations["imaginary_cm-1"]) == 1
     assert vibrations["imaginary_cm-1"][0] < 0
@@ -113,12 +197,13 @@ def test_parse_ru1121_c_ch_ts_with_pair_averaging_and_ts_note(tmp_path):
     assert "Dropped unpaired real mode" in vibrations["pairing_note"]
 
 
-def test_parse_outcar_as_optimization_uses_last_ionic_step(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ni311_C.zip", tmp_path)
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_parse_outcar_as_optimization_uses_last_ionic_step(extract_outcar, ni311_last_atoms):
+    outcar = extract_outcar("OUTCAR_Ni311_C.zip")
 
     data = parse_vasp_optimization(outcar)
 
-    last_atoms = read(outcar, index=-1)
+    last_atoms = ni311_last_atoms
 
     assert data["calculation"]["type"] == "optimization"
     assert data["calculation"]["version"] == "5.3.5"
@@ -126,13 +211,58 @@ def test_parse_outcar_as_optimization_uses_last_ionic_step(tmp_path):
     assert "vibrations" not in data
 
     expected_last_coords = [
-        f"{atom.symbol} " + " ".join(f"{x:.8f}" for x in pos)
-        for atom, pos in zip(last_atoms, last_atoms.get_scaled_positions())
+        f"{symbol} {x:.8f} {y:.8f} {z:.8f}"
+        for symbol, (x, y, z) in zip(
+            last_atoms.get_chemical_symbols(),
+            last_atoms.get_scaled_positions().tolist(),
+        )
     ]
     assert data["structure"]["coordinates_direct"] == expected_last_coords
     assert isinstance(data["energy"]["electronic"], float)
 
 
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_repeated_parses_reuse_scan_without_sharing_results(extract_outcar):
+    outcar = extract_outcar("OUTCAR_Ni311_C.zip")
+
+    first = parse_vasp_frequency(outcar)
+    first["calculation"]["incar"].clear()
+    second = parse_vasp_optimization(outcar)
+
+    assert second["calculation"]["incar"]
+    assert second["calculation"]["version"] == first["calculation"]["version"]
+
+    invalidate_cache()
+    assert parse_vasp_optimization(outcar)["calculation"] == second["calculation"]
+
+
+def test_clean_none_drops_none_values_and_reuses_untouched_blocks():
+    matrix = [InlineList([1.0, 2.0]), InlineList([3.0, 4.0])]
+    data = {"hessian": {"matrix": matrix}, "note": None, "modes": [{"x": None}]}
+
+    cleaned = clean_none(data)
+
+    assert cleaned == {"hessian": {"matrix": matrix}, "modes": [{}]}
+    assert cleaned["hessian"] is data["hessian"]
+    assert cleaned["hessian"]["matrix"] is matrix
+    assert type(cleaned["hessian"]["matrix"][0]) is InlineList
+    assert data["modes"] == [{"x": None}]
+
+
+def test_write_yaml_does_not_alias_shared_lists(tmp_path):
+    labels = ["1X", "1Y"]
+    row = [1.0, 2.0]
+    data = {"a": {"dof_labels": labels, "matrix": [row, row]}, "b": labels}
+
+    yaml_path = tmp_path / "shared.yaml"
+    write_yaml(data, yaml_path)
+
+    text = yaml_path.read_text()
+    assert "&id" not in text
+    assert "*id" not in text
+    assert yaml.load(text, Loader=_YamlLoader) == data
+
+
 def test_average_mode_pairs_also_pairs_imaginary_modes():
     real_freqs = [100.0, 102.0, 150.0, 154.0]
     imag_freqs = [-400.0, -396.0]
@@ -144,8 +274,20 @@ def test_average_mode_pairs_also_pairs_imaginary_modes():
     assert note is None
 
 
-def test_parse_optimization_falls_back_when_ase_cannot_parse_positions(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ru1121_empty.zip", tmp_path)
+def test_average_mode_pairs_accepts_numpy_arrays():
+    real_freqs = np.array([100.0, 102.0, 150.0])
+    imag_freqs = np.array([-400.0])
+
+    averaged_real, averaged_imag, note = average_mode_pairs(real_freqs, imag_freqs)
+
+    assert averaged_real == [101.0]
+    assert averaged_imag == [-400.0]
+    assert all(type(freq) is float for freq in averaged_real + averaged_imag)
+    assert "Dropped unpaired real mode (150.000000 cm-1)" in note
+
+
+def test_parse_optimization_falls_back_when_ase_cannot_parse_positions(extract_outcar):
+    outcar = extract_outcar("OUTCAR_Ru1121_empty.zip")
 
     data = parse_vasp_optimization(outcar)
 
@@ -157,31 +299,47 @@ def test_parse_optimization_falls_back_when_ase_cannot_parse_positions(tmp_path)
     assert data["energy"]["electronic"] == sigma0_energies[-1]
 
 
-def test_partial_hessian_roundtrip_recovers_vasp_frequencies(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ni311_C.zip", tmp_path)
-
-    data = parse_vasp_frequency(outcar)
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_partial_hessian_roundtrip_recovers_vasp_frequencies(
+    tmp_path, ni311_frequency, ni311_last_atoms
+):
     yaml_path = tmp_path / "freq.yaml"
-    write_yaml(data, yaml_path)
+    write_yaml(ni311_frequency, yaml_path)
 
-    loaded = yaml.safe_load(yaml_path.read_text())
+    loaded = yaml.load(yaml_path.read_bytes(), Loader=_YamlLoader)
     partial_hessian = loaded["vibrations"]["partial_hessian"]
 
     recovered = frequencies_from_partial_hessian(
         partial_hessian["dof_labels"],
         partial_hessian["matrix"],
-        read(outcar),
+        ni311_last_atoms,
     )
 
-    reported = sorted(loaded["vibrations"]["frequencies_cm-1"], reverse=True)
-    assert len(recovered) == len(reported)
+    reported = loaded["vibrations"]["frequencies_cm-1"]
+    assert recovered == pytest.approx(reported, abs=2.0)
+
+
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_frequencies_from_partial_hessian_accepts_numpy_matrix(
+    ni311_frequency, ni311_last_atoms
+):
+    partial_hessian = ni311_frequency["vibrations"]["partial_hessian"]
+    matrix = np.asarray(partial_hessian["matrix"], dtype=np.float64)
+    original = matrix.copy()
+
+    recovered = frequencies_from_partial_hessian(
+        partial_hessian["dof_labels"], matrix, ni311_last_atoms
+    )
 
-    for rec, rep in zip(recovered, reported):
-        assert rec == pytest.approx(rep, abs=2.0)
+    assert recovered == frequencies_from_partial_hessian(
+        partial_hessian["dof_labels"], partial_hessian["matrix"], ni311_last_atoms
+    )
+    np.testing.assert_array_equal(matrix, original)
 
 
-def test_parse_ase_vibrations_merges_vib_directories(tmp_path):
-    root = _extract_outcar("CeO2_Pd4_CO.zip", tmp_path)
+@pytest.mark.xdist_group("CeO2_Pd4_CO")
+def test_parse_ase_vibrations_merges_vib_directories(extract_outcar):
+    root = extract_outcar("CeO2_Pd4_CO.zip")
 
     data = parse_ase_vibrations(root / "OUTCAR")
 
@@ -200,8 +358,9 @@ def test_parse_ase_vibrations_merges_vib_directories(tmp_path):
     assert any(freq > 50.0 for freq in freqs)
 
 
-def test_extract_ase_vibration_hessian_has_expected_shape(tmp_path):
-    root = _extract_outcar("CeO2_Pd4_CO.zip", tmp_path)
+@pytest.mark.xdist_group("CeO2_Pd4_CO")
+def test_extract_ase_vibration_hessian_has_expected_shape(extract_outcar):
+    root = extract_outcar("CeO2_Pd4_CO.zip")
 
     labels, matrix = extract_ase_vibration_hessian(root / "OUTCAR")
 
@@ -210,8 +369,9 @@ def test_extract_ase_vibration_hessian_has_expected_shape(tmp_path):
     assert all(len(row) == 12 for row in matrix)
 
 
-def test_extract_ase_vibration_hessian_recovers_nonzero_frequencies(tmp_path):
-    root = _extract_outcar("CeO2_Pd4_CO.zip", tmp_path)
+@pytest.mark.xdist_group("CeO2_Pd4_CO")
+def test_extract_ase_vibration_hessian_recovers_nonzero_frequencies(extract_outcar):
+    root = extract_outcar("CeO2_Pd4_CO.zip")
     outcar = root / "OUTCAR"
 
     labels, matrix = extract_ase_vibration_hessian(outcar)
@@ -222,8 +382,8 @@ def test_extract_ase_vibration_hessian_recovers_nonzero_frequencies(tmp_path):
     assert recovered[-1] > 10.0
 
 
-def test_parse_ase_vibrations_detects_imaginary_mode_for_ts(tmp_path):
-    root = _extract_outcar("CeO2_Pd4_COox.zip", tmp_path)
+def test_parse_ase_vibrations_detects_imaginary_mode_for_ts(extract_outcar):
+    root = extract_outcar("CeO2_Pd4_COox.zip")
 
     data = parse_ase_vibrations(root / "OUTCAR")
     vibrations = data["vibrations"]
@@ -234,8 +394,8 @@ def test_parse_ase_vibrations_detects_imaginary_mode_for_ts(tmp_path):
     assert all(freq > 0.0 for freq in vibrations["frequencies_cm-1"])
 
 
-def test_parse_frequency_reconstructs_hessian_from_modes_when_block_missing(tmp_path):
-    outcar = _extract_outcar("OUTCAR_CO2.zip", tmp_path) / "OUTCAR"
+def test_parse_frequency_reconstructs_hessian_from_modes_when_block_missing(extract_outcar):
+    outcar = extract_outcar("OUTCAR_CO2.zip") / "OUTCAR"
 
     data = parse_vasp_frequency(outcar)
     partial = data["vibrations"].get("partial_hessian")
@@ -246,8 +406,56 @@ def test_parse_frequency_reconstructs_hessian_from_modes_when_block_missing(tmp_
     assert all(len(row) == 9 for row in partial["matrix"])
 
 
-def test_parse_frequency_uses_second_derivatives_not_mass_weighted(tmp_path):
-    outcar = _extract_outcar("OUTCAR_Ru1121_CO.zip", tmp_path)
+def test_parse_frequency_handles_suffixed_potcar_names(extract_outcar, tmp_path):
+    outcar = extract_outcar("OUTCAR_CO2.zip") / "OUTCAR"
+    suffixed = _with_potcar_names(
+        outcar, tmp_path / "OUTCAR", {"C": "C_s", "O": "O_s"}
+    )
+
+    reference = parse_vasp_frequency(outcar)
+    data = parse_vasp_frequency(suffixed)
+
+    # O_s is oxygen, not osmium: same formula and the same mass-weighted
+    # Hessian reconstructed from the eigenvectors.
+    assert data["structure"]["formula"] == reference["structure"]["formula"]
+    assert (
+        data["vibrations"]["partial_hessian"]["matrix"]
+        == reference["vibrations"]["partial_hessian"]["matrix"]
+    )
+
+
+@pytest.mark.xdist_group("OUTCAR_Ni311_C")
+def test_parse_optimization_handles_suffixed_potcar_names(extract_outcar, tmp_path):
+    outcar = extract_outcar("OUTCAR_Ni311_C.zip")
+    suffixed = _with_potcar_names(
+        outcar, tmp_path / "OUTCAR", {"Ni": "Ni_pv", "C": "C_s"}
+    )
+
+    reference = parse_vasp_optimization(outcar)
+    data = parse_vasp_optimization(suffixed)
+
+    assert data["structure"] == reference["structure"]
+    assert data["energy"] == reference["energy"]
+
+
+@pytest.mark.xdist_group("CeO2_Pd4_CO")
+def test_parse_ase_vibrations_handles_suffixed_potcar_names(extract_outcar, tmp_path):
+    root = extract_outcar("CeO2_Pd4_CO.zip")
+    copy = shutil.copytree(root, tmp_path / root.name)
+    _with_potcar_names(
+        root / "OUTCAR", copy / "OUTCAR", {"O": "O_s", "Ce": "Ce_sv", "Pd": "Pd_pv"}
+    )
+
+    reference = parse_ase_vibrations(root / "OUTCAR")
+    data = parse_ase_vibrations(copy / "OUTCAR")
+
+    # Oxygen masses, not osmium, go into the mass-weighted Hessian.
+    assert data["structure"]["formula"] == reference["structure"]["formula"]
+    assert data["vibrations"]["frequencies_cm-1"] == reference["vibrations"]["frequencies_cm-1"]
+
+
+def test_parse_frequency_uses_second_derivatives_not_mass_weighted(extract_outcar):
+    outcar = extract_outcar("OUTCAR_Ru1121_CO.zip")
 
     data = parse_vasp_frequency(outcar)
     partial = data["vibrations"]["partial_hessian"]